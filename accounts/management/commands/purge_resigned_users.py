@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.tasks import PURGE_CHUNK_SIZE, purge_user
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "탈퇴 처리가 끝나지 않은 계정의 데이터를 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=PURGE_CHUNK_SIZE)
+        # 탈퇴 직후 백그라운드 삭제 작업과 겹치지 않도록 일정 시간이 지난 계정만 처리
+        parser.add_argument("--older-than", type=int, default=10, help="탈퇴 후 지난 시간 (분)")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options["older_than"])
+        user_pks = User.objects.filter(
+            is_active=False, resigned_at__lte=cutoff
+        ).values_list("pk", flat=True)
+
+        count = 0
+        for user_pk in list(user_pks):
+            purge_user(user_pk, chunk_size=options["chunk_size"])
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{count}개 계정 삭제 완료"))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-19 11:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='resigned_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='탈퇴 요청 시각'),
+        ),
+    ]
@@ -24,6 +24,8 @@ class User(AbstractUser):
     profile_image = models.ImageField(
         "프로필 이미지", default='profile/default.png', upload_to="profile/", blank=True, null=True
     )
+    # 탈퇴 요청 시각 (데이터 삭제는 백그라운드에서 진행)
+    resigned_at = models.DateTimeField("탈퇴 요청 시각", blank=True, null=True)
 
     followings = models.ManyToManyField(
         "self",
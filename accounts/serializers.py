@@ -65,6 +65,17 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         model = User
         fields = ("username", "profile_image")
 
+    def update(self, instance, validated_data):
+        old_image = instance.profile_image.name if instance.profile_image else None
+        instance = super().update(instance, validated_data)
+
+        # 프로필 이미지를 새로 저장/삭제한 경우 이전 이미지 참조 해제 (기본 이미지 제외)
+        # (같은 내용을 다시 올려 이름이 같아도 새 참조가 추가되었으므로 해제)
+        default_image = User._meta.get_field("profile_image").default
+        if old_image and old_image != default_image and "profile_image" in validated_data:
+            instance.profile_image.storage.delete(old_image)
+        return instance
+
 
 class PasswordChangeSerializer(serializers.Serializer):
     old_password = serializers.CharField(write_only=True)
@@ -0,0 +1,140 @@
+import logging
+import os
+import threading
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+# 한 트랜잭션에서 삭제할 최대 행 수 (락 유지 시간 제한)
+PURGE_CHUNK_SIZE = 500
+
+DEFAULT_PROFILE_IMAGE = User._meta.get_field("profile_image").default
+
+
+def _delete_in_chunks(queryset, chunk_size=PURGE_CHUNK_SIZE):
+    # pk 목록을 나누어 짧은 트랜잭션으로 삭제
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            break
+        with transaction.atomic():
+            queryset.model.objects.filter(pk__in=pks).delete()
+
+
+def _purge_products(user, chunk_size=PURGE_CHUNK_SIZE):
+    from products.models import Products, ProductLike
+
+    # 해시태그 상품 수 / 이미지 참조는 삭제 signal 에서 정리 (products/signals.py)
+    while True:
+        pks = list(Products.objects.filter(author=user).values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            break
+        with transaction.atomic():
+            ProductLike.objects.filter(product_id__in=pks).delete()
+            Products.objects.filter(pk__in=pks).delete()
+
+
+def _purge_archived_products(user, chunk_size=PURGE_CHUNK_SIZE):
+    from products.models import ArchivedProduct, ArchivedProductLike
+
+    while True:
+        pks = list(
+            ArchivedProduct.objects.filter(author=user).values_list("pk", flat=True)[:chunk_size]
+        )
+        if not pks:
+            break
+        with transaction.atomic():
+            ArchivedProductLike.objects.filter(product_id__in=pks).delete()
+            ArchivedProduct.objects.filter(pk__in=pks).delete()
+
+
+def _purge_likes(user, chunk_size=PURGE_CHUNK_SIZE):
+    from products.models import Products, ProductLike
+
+    # 사용자가 누른 좋아요 삭제 후 상품의 좋아요 수 감소
+    while True:
+        chunk = list(
+            ProductLike.objects.filter(user=user).values_list("pk", "product_id")[:chunk_size]
+        )
+        if not chunk:
+            break
+        with transaction.atomic():
+            ProductLike.objects.filter(pk__in=[pk for pk, _ in chunk]).delete()
+            Products.objects.filter(pk__in=[product_id for _, product_id in chunk]).update(
+                like_count=F("like_count") - 1
+            )
+
+
+def _remove_media(user):
+    # products/<username>/ 디렉토리 정리
+    try:
+        products_dir = default_storage.path(f"products/{user.username}")
+    except NotImplementedError:
+        products_dir = None
+    if products_dir and os.path.isdir(products_dir):
+        try:
+            os.rmdir(products_dir)
+        except OSError:
+            logger.warning("미디어 디렉토리 삭제 실패: %s", products_dir)
+
+    # 기본 이미지는 공유 파일이므로 삭제하지 않음
+    if user.profile_image and user.profile_image.name != DEFAULT_PROFILE_IMAGE:
+        default_storage.delete(user.profile_image.name)
+
+
+def purge_user(user_pk, chunk_size=PURGE_CHUNK_SIZE):
+    """
+    탈퇴한 사용자의 데이터를 나누어 삭제
+    - 대기 중인 재고 예약 해제 (재고 반환)
+    - 상품 / 보관 상품 / 좋아요 / 팔로우 / 토큰을 chunk 단위 트랜잭션으로 삭제
+    - 상품 이미지, 프로필 이미지 삭제
+    """
+    from accounts.models import Follow
+    from products.models import ArchivedProductLike
+    from products.stock import release_user_reservations
+    from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+    user = User.objects.filter(
+        pk=user_pk, is_active=False, resigned_at__isnull=False
+    ).first()
+    if user is None:
+        return
+
+    release_user_reservations(user, chunk_size)
+    _purge_products(user, chunk_size)
+    _purge_archived_products(user, chunk_size)
+    _purge_likes(user, chunk_size)
+    # 보관 상품의 좋아요 수는 복원 시 남은 좋아요로 다시 계산
+    _delete_in_chunks(ArchivedProductLike.objects.filter(user=user), chunk_size)
+    _delete_in_chunks(Follow.objects.filter(follower=user), chunk_size)
+    _delete_in_chunks(Follow.objects.filter(following=user), chunk_size)
+    _delete_in_chunks(OutstandingToken.objects.filter(user=user), chunk_size)
+
+    # 연관 데이터가 정리되었으므로 사용자 삭제는 짧게 끝남
+    with transaction.atomic():
+        User.objects.filter(pk=user.pk).delete()
+
+    _remove_media(user)
+
+
+def _run_purge(user_pk):
+    try:
+        purge_user(user_pk)
+    except Exception:
+        # 실패한 계정은 purge_resigned_users 명령으로 다시 처리
+        logger.exception("회원 탈퇴 처리 실패: user_pk=%s", user_pk)
+    finally:
+        connection.close()
+
+
+def purge_user_async(user_pk):
+    # 요청 스레드와 분리하여 백그라운드에서 삭제
+    thread = threading.Thread(target=_run_purge, args=(user_pk,), daemon=True)
+    thread.start()
+    return thread
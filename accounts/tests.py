@@ -1,3 +1,223 @@
+import math
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import Follow, User
+from accounts.tasks import purge_user
+from products import stock
+from products.models import Category, HashTag, ProductLike, Products, Reservation
+from spartamarket.throttling import SlidingWindowRateThrottle
+
+
+class FixedClockThrottle(SlidingWindowRateThrottle):
+    rate = "10/min"
+    now_value = 0
+
+    def timer(self):
+        return self.now_value
+
+    def get_cache_key(self, request, view):
+        return "throttle_test"
+
+
+class SlidingWindowRateThrottleTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def request_at(self, now):
+        throttle = FixedClockThrottle()
+        throttle.now_value = now
+        return throttle, throttle.allow_request(None, None)
+
+    def assert_retry_allowed(self, now, throttle):
+        # 클라이언트는 Retry-After(올림한 초) 만큼 기다린 뒤 재시도
+        retry_at = now + math.ceil(throttle.wait())
+        self.assertTrue(self.request_at(retry_at)[1])
+
+    def test_previous_window_is_weighted_by_remaining_time(self):
+        # 이전 구간(0~60초)에 한도까지 요청
+        for second in range(10):
+            self.assertTrue(self.request_at(second)[1])
+
+        # 90초 : 이전 구간 가중치 0.5 → 10 * 0.5 + 현재 구간 5 = 10 까지 허용
+        for _ in range(5):
+            self.assertTrue(self.request_at(90)[1])
+        throttle, allowed = self.request_at(90)
+        self.assertFalse(allowed)
+
+        # 거절된 요청 포함 현재 구간 6 : 10 * (1 - e/60) + 7 <= 10 → e=42 (102초)
+        self.assertAlmostEqual(throttle.wait(), 12)
+        self.assert_retry_allowed(90, throttle)
+
+    def test_retry_after_is_not_too_short(self):
+        for second in range(10):
+            self.assertTrue(self.request_at(second)[1])
+        for _ in range(5):
+            self.assertTrue(self.request_at(90)[1])
+        throttle, _ = self.request_at(90)
+
+        # 안내된 시간보다 1초 먼저 재시도하면 거절
+        self.assertFalse(self.request_at(90 + math.ceil(throttle.wait()) - 1)[1])
+
+    def test_wait_when_current_window_is_full(self):
+        for _ in range(10):
+            self.assertTrue(self.request_at(60)[1])
+        throttle, allowed = self.request_at(75)
+        self.assertFalse(allowed)
+
+        # 다음 구간에서 현재 구간 카운트(11) 가중치가 9/11 이하가 되는 시점
+        self.assertAlmostEqual(throttle.wait(), 45 + (1 - 9 / 11) * 60)
+        self.assert_retry_allowed(75, throttle)
+
+    def test_wait_when_one_request_left_in_current_window(self):
+        # 현재 구간 카운트가 한도 - 1 이면 이번 구간 안에서는 재시도 불가
+        for second in range(10):
+            self.assertTrue(self.request_at(second)[1])
+        for _ in range(4):
+            self.assertTrue(self.request_at(100)[1])
+        for _ in range(4):
+            self.request_at(100)
+        throttle, allowed = self.request_at(100)
+        self.assertFalse(allowed)
+        self.assertEqual(throttle.current, 9)
+
+        self.assert_retry_allowed(100, throttle)
+
+
+class LoginThrottleTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        User.objects.create_user(
+            email="user@example.com", password="qwer1234!@", username="user"
+        )
+
+    def test_account_throttle_returns_429_with_retry_after(self):
+        for _ in range(5):
+            response = self.client.post(
+                "/accounts/login/", {"email": "user@example.com", "password": "wrong"}
+            )
+            self.assertEqual(response.status_code, 400)
+
+        # 대소문자/공백이 달라도 같은 계정으로 집계
+        response = self.client.post(
+            "/accounts/login/", {"email": " USER@example.com", "password": "wrong"}
+        )
+
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response["Retry-After"]), 0)
+
+    def test_malformed_body_is_not_a_server_error(self):
+        for body in ({"email": 5}, {"email": None}, [1, 2], "email"):
+            with self.subTest(body=body):
+                response = self.client.post(
+                    "/accounts/login/", body, content_type="application/json"
+                )
+                self.assertEqual(response.status_code, 400)
+                response = self.client.post(
+                    "/accounts/signup/", body, content_type="application/json"
+                )
+                self.assertEqual(response.status_code, 400)
+
+
+class ResignTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = User.objects.create_user(
+            email="user@example.com", password="qwer1234!@", username="user"
+        )
+        self.other = User.objects.create_user(
+            email="other@example.com", password="qwer1234!@", username="other"
+        )
+        self.category = Category.objects.create(name="test")
+        self.product = self.create_product(self.user, "#빈티지 상품")
+        self.other_product = self.create_product(self.other, "#빈티지 다른 상품")
+        self.other_product.add_like(self.user)
+        self.product.add_like(self.other)
+        Follow.objects.create(follower=self.user, following=self.other)
+
+    def create_product(self, author, content):
+        return Products.objects.create(
+            title="상품",
+            author=author,
+            content=content,
+            product_name="상품",
+            price=1000,
+            quantity=1,
+            category=self.category,
+        )
+
+    def resign(self):
+        self.user.is_active = False
+        self.user.resigned_at = timezone.now()
+        self.user.save(update_fields=["is_active", "resigned_at"])
+
+    def test_resign_deactivates_and_hides_products(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        with mock.patch("accounts.views.purge_user_async") as purge_user_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = client.delete("/accounts/resign/", {"password": "qwer1234!@"})
+
+        self.assertEqual(response.status_code, 204)
+        purge_user_async.assert_called_once_with(self.user.pk)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+        self.assertIsNotNone(self.user.resigned_at)
+
+        # 삭제 전까지 다른 사용자에게 보이지 않음
+        listed = [item["id"] for item in self.client.get("/products/").data["results"]]
+        self.assertEqual(listed, [self.other_product.pk])
+        self.assertEqual(self.client.get(f"/products/{self.product.pk}/").status_code, 404)
+
+    def test_purge_user_removes_data_and_counters(self):
+        self.resign()
+
+        purge_user(self.user.pk, chunk_size=1)
+
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse(Products.objects.filter(pk=self.product.pk).exists())
+        self.assertFalse(ProductLike.objects.filter(product=self.product).exists())
+        self.assertFalse(Follow.objects.exists())
+        self.other_product.refresh_from_db()
+        self.assertEqual(self.other_product.like_count, 0)
+        self.assertEqual(HashTag.objects.get(name="빈티지").product_count, 1)
+
+    def test_purge_user_returns_reserved_stock(self):
+        self.other_product.quantity = 5
+        self.other_product.save(update_fields=["quantity"])
+        stock.reserve(self.user, self.other_product.pk, 3)
+        self.resign()
+
+        purge_user(self.user.pk)
+
+        self.other_product.refresh_from_db()
+        self.assertEqual(self.other_product.quantity, 5)
+        self.assertFalse(Reservation.objects.exists())
+
+    def test_purge_user_skips_active_user(self):
+        purge_user(self.user.pk)
+
+        self.assertTrue(User.objects.filter(pk=self.user.pk).exists())
+
+    def test_purge_command_retries_interrupted_purge(self):
+        self.resign()
+
+        # 탈퇴 직후 계정은 백그라운드 작업과 겹치지 않도록 건너뜀
+        call_command("purge_resigned_users", stdout=mock.Mock())
+        self.assertTrue(User.objects.filter(pk=self.user.pk).exists())
 
-# Create your tests here.
+        User.objects.filter(pk=self.user.pk).update(
+            resigned_at=timezone.now() - timedelta(minutes=30)
+        )
+        call_command("purge_resigned_users", stdout=mock.Mock())
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
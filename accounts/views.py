@@ -3,6 +3,7 @@ from rest_framework.decorators import (
     api_view,
     permission_classes,
     authentication_classes,
+    throttle_classes,
 )
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
@@ -17,21 +18,29 @@ from django.contrib.auth import authenticate, get_user_model
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema
-from drf_spectacular.utils import OpenApiParameter
-from drf_spectacular.utils import OpenApiExample
+from django.db import transaction
+from django.utils import timezone
+from .tasks import purge_user_async
+from spartamarket.throttling import (
+    LoginIPThrottle,
+    LoginAccountThrottle,
+    SignupIPThrottle,
+    SignupAccountThrottle,
+)
 
 User = get_user_model()
 
 """
 @authentication_classes([]) : 전역 인증 설정 무시
 @permission_classes([AllowAny]) : 전역 IsAuthenticated 설정 무시
+@throttle_classes([...]) : 비밀번호 해시 연산 전에 IP/계정별 요청 제한
 """
 
 
 @api_view(["POST"])
 @authentication_classes([])
 @permission_classes([AllowAny])
+@throttle_classes([SignupIPThrottle, SignupAccountThrottle])
 def signup(request):
     serializer = SignupSerializer(data=request.data)
     if serializer.is_valid():
@@ -58,23 +67,22 @@ def resign(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    try:
-        # 비밀번호가 일치하면 계정 삭제
-        user.delete()
-        return Response(
-            {"message": "회원 탈퇴가 완료되었습니다."},
-            status=status.HTTP_204_NO_CONTENT,
-        )
-    except User.DoesNotExist:
-        return Response(
-            {"message": "사용자를 찾을 수 없습니다."},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
+    # 비밀번호가 일치하면 계정 비활성화 후 데이터 삭제는 백그라운드에서 진행
+    user.is_active = False
+    user.resigned_at = timezone.now()
+    user.save(update_fields=["is_active", "resigned_at"])
+    transaction.on_commit(lambda: purge_user_async(user.pk))
+
+    return Response(
+        {"message": "회원 탈퇴가 완료되었습니다."},
+        status=status.HTTP_204_NO_CONTENT,
+    )
 
 
 @api_view(["POST"])
 @authentication_classes([])
 @permission_classes([AllowAny])
+@throttle_classes([LoginIPThrottle, LoginAccountThrottle])
 def login(request):
     email = request.POST.get("email")
     password = request.POST.get("password")
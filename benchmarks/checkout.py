@@ -0,0 +1,118 @@
+"""
+동시 구매 처리량(구매 시도/초) 측정
+
+    python benchmarks/checkout.py --buyers 200 --quantity 50 --runs 3
+
+테스트 DB를 새로 만들어 상품 1개를 등록한 뒤 구매자 스레드가 동시에 1개씩 구매를 시도합니다.
+재고 이상 판매되지 않았는지도 함께 확인합니다.
+SQLite 테스트 DB는 DB 단위 쓰기 잠금이라 처리량이 낮게 측정됩니다.
+(운영 DB 기준 측정: POSTGRES_* 환경 변수와 DJANGO_SETTINGS_MODULE=spartamarket.settings_production)
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "spartamarket.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import OperationalError, connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from accounts.models import User  # noqa: E402
+from products import stock  # noqa: E402
+from products.models import Category, Products  # noqa: E402
+
+
+def create_product(quantity):
+    seller, _ = User.objects.get_or_create(
+        email="seller@example.com", defaults={"username": "seller"}
+    )
+    category, _ = Category.objects.get_or_create(name="benchmark")
+    return Products.objects.create(
+        title="상품",
+        author=seller,
+        content="",
+        product_name="상품",
+        price=1000,
+        quantity=quantity,
+        category=category,
+    )
+
+
+def run_buyers(product, buyers):
+    results = {"sold": 0, "out_of_stock": 0}
+    lock = threading.Lock()
+    start_event = threading.Event()
+
+    def buy():
+        start_event.wait()
+        try:
+            while True:
+                try:
+                    stock.purchase([(product.pk, 1)])
+                    outcome = "sold"
+                except stock.OutOfStockError:
+                    outcome = "out_of_stock"
+                except OperationalError:
+                    # SQLite 쓰기 잠금 : 잠시 후 재시도
+                    time.sleep(random.uniform(0, 0.005))
+                    continue
+                break
+            with lock:
+                results[outcome] += 1
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=buy) for _ in range(buyers)]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    start_event.set()
+    for thread in threads:
+        thread.join()
+    results["elapsed_s"] = time.perf_counter() - started
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--buyers", type=int, default=200)
+    parser.add_argument("--quantity", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        elapsed = []
+        for _ in range(args.runs):
+            product = create_product(args.quantity)
+            results = run_buyers(product, args.buyers)
+            product.refresh_from_db()
+            if product.quantity < 0 or results["sold"] != args.quantity - product.quantity:
+                raise SystemExit(f"초과 판매 발생 : {results}, 남은 재고 {product.quantity}")
+            elapsed.append(results["elapsed_s"])
+
+        median = statistics.median(elapsed)
+        print(f"{'database':<12} {'buyers':>7} {'elapsed(ms)':>12} {'purchases/s':>12}")
+        print(
+            f"{connection.vendor:<12} {args.buyers:>7} {median * 1000:>12.1f} "
+            f"{args.buyers / median:>12.0f}"
+        )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+워커 cold start 시간 / 메모리(RSS) 측정
+
+    python benchmarks/startup.py --runs 5
+
+설정별로 새 파이썬 프로세스를 띄워 WSGI application 로딩 + warm up(URL/serializer 로딩)까지,
+즉 첫 요청을 받을 수 있는 상태가 될 때까지의 시간과 그 시점의 RSS를 측정합니다.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SETTINGS = [
+    "spartamarket.settings",
+    "spartamarket.settings_production",
+]
+
+# 자식 프로세스 : application 로딩 후 소요 시간과 RSS 출력
+WORKER_CODE = """
+import json, os, sys, time
+start = time.perf_counter()
+from spartamarket.wsgi import application
+from spartamarket.warmup import warm_up
+warm_up()
+elapsed = time.perf_counter() - start
+
+rss_kb = None
+try:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                rss_kb = int(line.split()[1])
+except OSError:
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        rss_kb //= 1024
+
+print(json.dumps({"import_s": elapsed, "rss_kb": rss_kb, "modules": len(sys.modules)}))
+"""
+
+
+def run_worker(settings_module):
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": settings_module,
+        "DJANGO_SECRET_KEY": os.environ.get("DJANGO_SECRET_KEY", "benchmark"),
+    }
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER_CODE],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = time.perf_counter() - start
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    data["total_s"] = total
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'settings':<36} {'cold start(ms)':>15} {'app load(ms)':>13} "
+        f"{'RSS(MB)':>8} {'modules':>8}"
+    )
+    for settings_module in SETTINGS:
+        results = [run_worker(settings_module) for _ in range(args.runs)]
+        total_ms = statistics.median(r["total_s"] for r in results) * 1000
+        import_ms = statistics.median(r["import_s"] for r in results) * 1000
+        rss_mb = statistics.median(r["rss_kb"] for r in results) / 1024
+        modules = results[-1]["modules"]
+        print(
+            f"{settings_module:<36} {total_ms:>15.1f} {import_ms:>13.1f} "
+            f"{rss_mb:>8.1f} {modules:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+gunicorn 설정 (운영 서버)
+
+gunicorn -c gunicorn.conf.py
+- 워커 수 : CPU 코어 수 * 2 + 1 (WEB_CONCURRENCY 로 변경)
+- preload_app : 마스터에서 앱을 한 번 로딩 후 fork (copy-on-write 메모리 공유)
+- 워커별 DB/캐시 연결은 fork 이후 요청을 받기 전에 준비
+"""
+
+import multiprocessing
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "spartamarket.settings_production")
+
+wsgi_app = "spartamarket.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 1))
+worker_class = "sync" if threads == 1 else "gthread"
+
+preload_app = True
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+# 메모리 증가 방지를 위해 일정 요청 후 워커 재시작 (동시에 재시작되지 않도록 jitter)
+max_requests = 2000
+max_requests_jitter = 200
+
+accesslog = "-"
+errorlog = "-"
+
+
+def pre_fork(server, worker):
+    # 마스터에서 연 커넥션을 워커가 공유하지 않도록 fork 전에 닫음
+    from django.db import connections
+
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    # 요청을 받기 전에 워커별 DB/캐시 연결 준비
+    from spartamarket.warmup import warm_connections
+
+    warm_connections()
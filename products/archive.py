@@ -0,0 +1,158 @@
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .hashtag_index import hashtag_index
+from .models import (
+    ArchivedProduct,
+    ArchivedProductLike,
+    ProductLike,
+    Products,
+    Reservation,
+)
+
+# settings.PRODUCT_ARCHIVE_RULES 로 변경 가능
+DEFAULT_ARCHIVE_RULES = {
+    "MAX_QUANTITY": 0,  # 재고가 이 값 이하인 상품
+    "INACTIVE_DAYS": 90,  # 마지막 수정 후 지난 일수
+    "BATCH_SIZE": 500,  # 한 트랜잭션에서 옮길 상품 수
+    "BATCH_PAUSE": 0.1,  # batch 사이 대기 시간 (초)
+}
+
+# Products → ArchivedProduct 로 그대로 옮기는 컬럼
+ARCHIVE_FIELDS = (
+    "title",
+    "author_id",
+    "content",
+    "created_at",
+    "updated_at",
+    "product_name",
+    "price",
+    "quantity",
+    "image",
+    "views",
+    "like_count",
+    "category_id",
+)
+
+
+def get_archive_rules(**overrides):
+    rules = {**DEFAULT_ARCHIVE_RULES, **getattr(settings, "PRODUCT_ARCHIVE_RULES", {})}
+    rules.update({key: value for key, value in overrides.items() if value is not None})
+    return rules
+
+
+def archivable_products(rules):
+    # 예약 중인 상품은 예약 만료 시 재고가 돌아올 수 있으므로 제외
+    cutoff = timezone.now() - timedelta(days=rules["INACTIVE_DAYS"])
+    return Products.objects.filter(
+        quantity__lte=rules["MAX_QUANTITY"], updated_at__lt=cutoff
+    ).exclude(reservations__status=Reservation.PENDING)
+
+
+def _archive_batch(queryset, batch_size):
+    hashtag_through = Products.hashtags.through
+
+    with transaction.atomic():
+        # 옮기는 동안 수정/구매되지 않도록 잠금 (다른 작업이 잠근 행은 건너뜀)
+        rows = list(
+            queryset.select_for_update(skip_locked=True)
+            .order_by("pk")
+            .values("pk", *ARCHIVE_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return 0
+        pks = [row.pop("pk") for row in rows]
+
+        hashtag_names = defaultdict(list)
+        for product_id, name in hashtag_through.objects.filter(
+            products_id__in=pks
+        ).values_list("products_id", "hashtag__name"):
+            hashtag_names[product_id].append(name)
+
+        ArchivedProduct.objects.bulk_create(
+            ArchivedProduct(id=pk, hashtag_names=sorted(hashtag_names[pk]), **row)
+            for pk, row in zip(pks, rows)
+        )
+        ArchivedProductLike.objects.bulk_create(
+            ArchivedProductLike(user_id=user_id, product_id=product_id, created_at=created_at)
+            for user_id, product_id, created_at in ProductLike.objects.filter(
+                product_id__in=pks
+            ).values_list("user_id", "product_id", "created_at")
+        )
+
+        ProductLike.objects.filter(product_id__in=pks).delete()
+        # 만료/확정된 예약은 재고 점유 기록이므로 함께 삭제
+        Reservation.objects.filter(product_id__in=pks).delete()
+        # 이미지는 보관 상품으로 옮겼으므로 삭제 시 참조 해제되지 않도록 비움
+        # (해시태그 상품 수는 삭제 signal 에서 감소)
+        Products.objects.filter(pk__in=pks).update(image=None)
+        Products.objects.filter(pk__in=pks).delete()
+
+        # 해시태그 상품 수가 줄었으므로 자동완성 스냅샷 재생성
+        transaction.on_commit(hashtag_index.invalidate_snapshot)
+    return len(pks)
+
+
+def archive_products(**overrides):
+    """
+    보관 규칙에 맞는 상품을 보관 테이블로 이동
+    - batch 단위 짧은 트랜잭션으로 이동 (batch 사이 대기로 부하 분산)
+    - 해시태그는 이름 목록으로, 좋아요는 ArchivedProductLike 로 보관
+    - 이미지 파일은 그대로 두고 이름만 옮김 (참조 수 변화 없음)
+    """
+    rules = get_archive_rules(**overrides)
+    queryset = archivable_products(rules)
+
+    archived = 0
+    while True:
+        moved = _archive_batch(queryset, rules["BATCH_SIZE"])
+        archived += moved
+        if moved < rules["BATCH_SIZE"]:
+            return archived
+        time.sleep(rules["BATCH_PAUSE"])
+
+
+def restore_product(product_id):
+    """
+    보관된 상품을 Products 테이블로 복원
+    - content 에서 해시태그를 다시 연결 (상품 수/자동완성 인덱스 반영)
+    - 보관된 좋아요를 원래 시각으로 복원
+    - 수정 시각이 갱신되어 바로 다시 보관되지 않음
+    """
+    with transaction.atomic():
+        values = (
+            ArchivedProduct.objects.select_for_update()
+            .filter(pk=product_id)
+            .values(*ARCHIVE_FIELDS)
+            .first()
+        )
+        if values is None:
+            raise ArchivedProduct.DoesNotExist(f"보관된 상품이 없습니다: {product_id}")
+
+        likes = list(
+            ArchivedProductLike.objects.filter(product_id=product_id).values_list(
+                "user_id", "created_at"
+            )
+        )
+        # 탈퇴한 사용자의 좋아요는 이미 삭제되었으므로 남은 좋아요 수로 맞춤
+        values["like_count"] = len(likes)
+
+        product = Products(id=product_id, **values)
+        product.save(force_insert=True)  # sync_hashtags 호출
+        # auto_now_add 로 덮어쓴 등록 시각 복원
+        Products.objects.filter(pk=product_id).update(created_at=values["created_at"])
+        product.created_at = values["created_at"]
+
+        ProductLike.objects.bulk_create(
+            ProductLike(user_id=user_id, product_id=product_id, created_at=created_at)
+            for user_id, created_at in likes
+        )
+        # 이미지는 복원된 상품으로 옮겼으므로 참조 해제되지 않도록 비운 뒤 삭제
+        ArchivedProduct.objects.filter(pk=product_id).update(image=None)
+        ArchivedProduct.objects.filter(pk=product_id).delete()
+    return product
@@ -0,0 +1,173 @@
+from datetime import datetime, time
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from .models import HashTag
+
+User = get_user_model()
+
+
+class ProductFilter:
+    """
+    상품 목록 필터/정렬
+    - 인덱스가 있는 필터/정렬 조합만 허용 (그 외 조합은 400)
+    - 정렬 결과는 keyset(cursor) 페이지네이션과 함께 사용
+    """
+
+    SORTS = {
+        "newest": ("-created_at", "-id"),
+        "price": ("price", "id"),
+        "-price": ("-price", "-id"),
+        "likes": ("-like_count", "-id"),
+    }
+    DEFAULT_SORT = "newest"
+
+    # 일치 필터별 허용 정렬 (Products.Meta.indexes 참고)
+    EQUALITY_SORTS = {
+        None: {"newest", "price", "-price", "likes"},
+        "category": {"newest", "price", "-price"},
+        "author": {"newest"},
+        "tag": {"newest"},
+    }
+    # 범위/조건 필터별 허용 정렬
+    RANGE_SORTS = {
+        "price": {"price", "-price"},
+        "created_at": {"newest"},
+        # 재고 조건은 최신순 부분 인덱스(products_in_stock_created_idx)만 있음
+        "in_stock": {"newest"},
+    }
+
+    PARAMS = (
+        "min_price",
+        "max_price",
+        "in_stock",
+        "category",
+        "author",
+        "tag",
+        "created_after",
+        "created_before",
+        "sort",
+    )
+
+    def __init__(self, query_params):
+        self.query_params = query_params
+
+    @property
+    def is_active(self):
+        return any(self.query_params.get(param) for param in self.PARAMS)
+
+    @property
+    def sort(self):
+        sort = self.query_params.get("sort") or self.DEFAULT_SORT
+        if sort not in self.SORTS:
+            raise ValidationError(
+                {"sort": f"지원하지 않는 정렬: {sort} ({', '.join(self.SORTS)})"}
+            )
+        return sort
+
+    @property
+    def ordering(self):
+        return self.SORTS[self.sort]
+
+    def _get_int(self, name):
+        value = self.query_params.get(name)
+        if not value:
+            return None
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValidationError({name: "정수여야 합니다."})
+        if value < 0:
+            raise ValidationError({name: "0 이상이어야 합니다."})
+        return value
+
+    def _get_datetime(self, name):
+        value = self.query_params.get(name)
+        if not value:
+            return None
+        try:
+            parsed = parse_datetime(value)
+            if parsed is None and parse_date(value):
+                parsed = datetime.combine(parse_date(value), time.min)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({name: "ISO 8601 형식의 날짜여야 합니다."})
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def _get_bool(self, name):
+        value = self.query_params.get(name, "").lower()
+        if value in ("", "0", "false"):
+            return False
+        if value in ("1", "true"):
+            return True
+        raise ValidationError({name: "true 또는 false 여야 합니다."})
+
+    def _validate_combination(self, equality, ranges, sort):
+        if len(equality) > 1:
+            raise ValidationError(
+                {"detail": "category / author / tag 필터는 하나만 사용할 수 있습니다."}
+            )
+        equality_filter = equality[0] if equality else None
+        if sort not in self.EQUALITY_SORTS[equality_filter]:
+            raise ValidationError(
+                {"detail": f"{equality_filter} 필터는 {sort} 정렬과 함께 사용할 수 없습니다."}
+            )
+        for range_filter in ranges:
+            if sort not in self.RANGE_SORTS[range_filter]:
+                raise ValidationError(
+                    {"detail": f"{range_filter} 필터는 {sort} 정렬과 함께 사용할 수 없습니다."}
+                )
+
+    def filter_queryset(self, queryset):
+        sort = self.sort
+        min_price = self._get_int("min_price")
+        max_price = self._get_int("max_price")
+        created_after = self._get_datetime("created_after")
+        created_before = self._get_datetime("created_before")
+        category = self._get_int("category")
+        author = self.query_params.get("author")
+        tag = self.query_params.get("tag", "").lstrip("#")
+
+        equality = [
+            name
+            for name, value in (("category", category), ("author", author), ("tag", tag))
+            if value
+        ]
+        in_stock = self._get_bool("in_stock")
+        ranges = []
+        if min_price is not None or max_price is not None:
+            ranges.append("price")
+        if created_after or created_before:
+            ranges.append("created_at")
+        if in_stock:
+            ranges.append("in_stock")
+        self._validate_combination(equality, ranges, sort)
+
+        if min_price is not None:
+            queryset = queryset.filter(price__gte=min_price)
+        if max_price is not None:
+            queryset = queryset.filter(price__lte=max_price)
+        if created_after:
+            queryset = queryset.filter(created_at__gte=created_after)
+        if created_before:
+            queryset = queryset.filter(created_at__lt=created_before)
+        if in_stock:
+            queryset = queryset.filter(quantity__gt=0)
+
+        if category:
+            queryset = queryset.filter(category_id=category)
+        if author:
+            # 닉네임(unique)으로 id를 먼저 조회하여 join 없이 필터
+            author_id = User.objects.filter(username=author).values_list("pk", flat=True).first()
+            queryset = queryset.filter(author_id=author_id) if author_id else queryset.none()
+        if tag:
+            hashtag_id = HashTag.objects.filter(name=tag).values_list("pk", flat=True).first()
+            queryset = queryset.filter(hashtags=hashtag_id) if hashtag_id else queryset.none()
+
+        return queryset.order_by(*self.ordering)
@@ -0,0 +1,134 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from django.core.cache import cache
+
+SNAPSHOT_CACHE_KEY = "products:hashtag_index:snapshot"
+SNAPSHOT_TIMEOUT = 60 * 10  # 공유 캐시 스냅샷 유지 시간 (초)
+REFRESH_INTERVAL = 60 * 5  # 프로세스 인덱스 갱신 주기 (초)
+TOP_K = 20  # prefix 별로 미리 계산해 두는 상위 해시태그 수 (suggest limit 상한)
+SHORT_PREFIX_LENGTH = 2  # 상위 목록을 미리 계산하는 prefix 최대 길이
+
+
+def _rank_key(weights):
+    # 사용 횟수 내림차순, 같으면 이름순
+    return lambda name: (-weights[name], name)
+
+
+class HashTagIndex:
+    """
+    해시태그 자동완성용 프로세스 내 prefix 인덱스
+    - 정렬된 이름 목록에서 bisect로 prefix 범위 탐색
+    - 상품 사용 횟수(weight) 순으로 정렬하여 반환
+    - 일치 범위가 넓은 짧은 prefix(1~2자)는 상위 TOP_K 목록을 미리 계산하여 범위 탐색 생략
+    - 공유 캐시 스냅샷으로 워커 시작 시 DB 집계 생략
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names = []
+        self._weights = {}
+        self._top = {}  # 짧은 prefix → 상위 TOP_K 해시태그 이름
+        self._stale_prefixes = set()  # 상위 목록을 다시 계산해야 하는 prefix
+        self._loaded_at = None
+
+    def _load(self, snapshot):
+        names = sorted(name for name, _ in snapshot)
+        weights = dict(snapshot)
+        top = self._build_top(names, weights)
+        with self._lock:
+            self._names = names
+            self._weights = weights
+            self._top = top
+            self._stale_prefixes = set()
+            self._loaded_at = time.monotonic()
+
+    @staticmethod
+    def _short_prefixes(name):
+        return [name[:length] for length in range(1, min(len(name), SHORT_PREFIX_LENGTH) + 1)]
+
+    def _build_top(self, names, weights):
+        # 잠금 밖에서 계산 후 교체
+        buckets = defaultdict(list)
+        for name in names:
+            for prefix in self._short_prefixes(name):
+                buckets[prefix].append(name)
+        key = _rank_key(weights)
+        return {
+            prefix: heapq.nsmallest(TOP_K, bucket, key=key)
+            for prefix, bucket in buckets.items()
+        }
+
+    def _range(self, prefix):
+        start = bisect_left(self._names, prefix)
+        # prefix 다음 문자열 직전까지가 일치 범위
+        end = bisect_left(self._names, prefix + "\U0010ffff", lo=start)
+        return self._names[start:end]
+
+    def _build_snapshot(self):
+        from .models import HashTag
+
+        return list(HashTag.objects.values_list("name", "product_count"))
+
+    def refresh(self, force=False):
+        snapshot = None if force else cache.get(SNAPSHOT_CACHE_KEY)
+        if snapshot is None:
+            snapshot = self._build_snapshot()
+            cache.set(SNAPSHOT_CACHE_KEY, snapshot, SNAPSHOT_TIMEOUT)
+        self._load(snapshot)
+
+    def _ensure_loaded(self):
+        if (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > REFRESH_INTERVAL
+        ):
+            self.refresh()
+
+    def invalidate_snapshot(self):
+        # 다음 갱신 시 DB에서 스냅샷을 다시 생성
+        cache.delete(SNAPSHOT_CACHE_KEY)
+
+    def add(self, name, weight=0):
+        # 해시태그 생성/연결 시 현재 프로세스 인덱스에 바로 반영
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            if name not in self._weights:
+                insort(self._names, name)
+            self._weights[name] = max(0, self._weights.get(name, 0) + weight)
+
+            key = _rank_key(self._weights)
+            for prefix in self._short_prefixes(name):
+                top = self._top.setdefault(prefix, [])
+                if name in top:
+                    top.sort(key=key)
+                    # 마지막 자리로 밀려나면 목록 밖 해시태그가 더 높을 수 있음
+                    if weight < 0 and len(top) == TOP_K and top[-1] == name:
+                        self._stale_prefixes.add(prefix)
+                elif len(top) < TOP_K or key(name) < key(top[-1]):
+                    top.append(name)
+                    top.sort(key=key)
+                    del top[TOP_K:]
+
+    def suggest(self, prefix, limit=10):
+        self._ensure_loaded()
+        with self._lock:
+            weights = self._weights
+            key = _rank_key(weights)
+            if len(prefix) <= SHORT_PREFIX_LENGTH and limit <= TOP_K:
+                if prefix in self._stale_prefixes:
+                    self._top[prefix] = heapq.nsmallest(TOP_K, self._range(prefix), key=key)
+                    self._stale_prefixes.discard(prefix)
+                matches = self._top.get(prefix, [])[:limit]
+            else:
+                # 긴 prefix 는 일치 범위가 좁으므로 범위 안에서만 정렬
+                matches = heapq.nsmallest(limit, self._range(prefix), key=key)
+            return [
+                {"name": name, "product_count": weights[name]} for name in matches
+            ]
+
+
+hashtag_index = HashTagIndex()
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from products.archive import archive_products
+
+
+class Command(BaseCommand):
+    help = "보관 규칙(PRODUCT_ARCHIVE_RULES)에 맞는 오래된 품절 상품을 보관 테이블로 옮깁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="마지막 수정 후 지난 일수")
+        parser.add_argument("--max-quantity", type=int, help="재고가 이 값 이하인 상품")
+        parser.add_argument("--batch-size", type=int, help="한 트랜잭션에서 옮길 상품 수")
+
+    def handle(self, *args, **options):
+        archived = archive_products(
+            INACTIVE_DAYS=options["days"],
+            MAX_QUANTITY=options["max_quantity"],
+            BATCH_SIZE=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"{archived}개 상품 보관 완료"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from products.stock import RELEASE_BATCH_SIZE, release_expired_reservations
+
+
+class Command(BaseCommand):
+    help = "만료된 재고 예약을 해제하고 재고를 반환합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=RELEASE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        released = release_expired_reservations(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{released}개 예약 해제 완료"))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from products.archive import restore_product
+from products.models import ArchivedProduct
+
+
+class Command(BaseCommand):
+    help = "보관된 상품을 다시 상품 목록으로 복원합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("product_ids", nargs="+", type=int)
+
+    def handle(self, *args, **options):
+        for product_id in options["product_ids"]:
+            try:
+                restore_product(product_id)
+            except ArchivedProduct.DoesNotExist as error:
+                raise CommandError(str(error))
+            self.stdout.write(self.style.SUCCESS(f"상품 {product_id} 복원 완료"))
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.8 on 2026-10-19 11:43
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import products.models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HashTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, validators=[products.models.validation_hashtag])),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Products',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=50)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product_name', models.CharField(max_length=100)),
+                ('price', models.PositiveIntegerField()),
+                ('quantity', models.PositiveIntegerField()),
+                ('image', models.ImageField(blank=True, null=True, upload_to=products.models.products_image_path)),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='products', to=settings.AUTH_USER_MODEL)),
+                ('category', models.ForeignKey(blank=True, on_delete=django.db.models.deletion.CASCADE, related_name='products', to='products.category')),
+                ('hashtags', models.ManyToManyField(blank=True, related_name='products', to='products.hashtag')),
+                ('like_user', models.ManyToManyField(blank=True, related_name='like_products', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.8 on 2026-10-19 11:43
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_products(apps, schema_editor):
+    # 기존 해시태그의 상품 수를 중간 테이블에서 계산 (UPDATE 1회)
+    HashTag = apps.get_model('products', 'HashTag')
+    Products = apps.get_model('products', 'Products')
+    counts = (
+        Products.hashtags.through.objects.filter(hashtag_id=OuterRef('pk'))
+        .values('hashtag_id')
+        .annotate(n=Count('id'))
+        .values('n')
+    )
+    HashTag.objects.update(product_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_mediablob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hashtag',
+            name='product_count',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(count_products, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='products',
+            index=models.Index(fields=['-created_at', '-id'], name='products_created_idx'),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.8 on 2026-10-19 11:43
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+BATCH_SIZE = 1000
+
+
+def copy_likes(apps, schema_editor):
+    # 기존 자동 중간 테이블의 좋아요를 ProductLike 로 복사 (좋아요 시각은 알 수 없으므로 현재 시각)
+    Products = apps.get_model('products', 'Products')
+    ProductLike = apps.get_model('products', 'ProductLike')
+    rows = Products.like_user.through.objects.values_list('user_id', 'products_id')
+    ProductLike.objects.bulk_create(
+        (ProductLike(user_id=user_id, product_id=product_id) for user_id, product_id in rows.iterator()),
+        batch_size=BATCH_SIZE,
+    )
+
+
+def restore_likes(apps, schema_editor):
+    Products = apps.get_model('products', 'Products')
+    ProductLike = apps.get_model('products', 'ProductLike')
+    Through = Products.like_user.through
+    rows = ProductLike.objects.values_list('user_id', 'product_id')
+    Through.objects.bulk_create(
+        (Through(user_id=user_id, products_id=product_id) for user_id, product_id in rows.iterator()),
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('products', '0003_hashtag_product_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductLike',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='likes', to='products.products')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_likes', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.RunPython(copy_likes, restore_likes),
+        # 자동 생성 중간 테이블 → ProductLike (through 변경은 AlterField 로 불가)
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RemoveField(
+                    model_name='products',
+                    name='like_user',
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='products',
+                    name='like_user',
+                    field=models.ManyToManyField(blank=True, related_name='like_products', through='products.ProductLike', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='productlike',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='product_like_user_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='productlike',
+            unique_together={('user', 'product')},
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.8 on 2026-10-19 11:43
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_likes(apps, schema_editor):
+    # 기존 상품의 좋아요 수를 ProductLike 에서 계산 (UPDATE 1회)
+    Products = apps.get_model('products', 'Products')
+    ProductLike = apps.get_model('products', 'ProductLike')
+    counts = (
+        ProductLike.objects.filter(product_id=OuterRef('pk'))
+        .values('product_id')
+        .annotate(n=Count('id'))
+        .values('n')
+    )
+    Products.objects.update(like_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0004_productlike'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='products',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_likes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='products',
+            index=models.Index(condition=models.Q(('quantity__gt', 0)), fields=['-created_at', '-id'], name='products_in_stock_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='products',
+            index=models.Index(fields=['price', 'id'], name='products_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='products',
+            index=models.Index(fields=['-like_count', '-id'], name='products_likes_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='products',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='products_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='products',
+            index=models.Index(fields=['category', 'price', 'id'], name='products_cat_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='products',
+            index=models.Index(fields=['author', '-created_at', '-id'], name='products_author_created_idx'),
+        ),
+    ]
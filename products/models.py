@@ -1,8 +1,13 @@
-from django.db import models
+from collections import defaultdict
+from django.db import models, transaction
+from django.db.models import Count, F
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 import re
 
+from .hashtag_index import hashtag_index
+
 def extract_hashtags(content):
     hashtags = re.findall(r"#([0-9a-zA-Z가-힣_]+)", content)  # # 뒤에 오는 단어들 찾기
     return hashtags
@@ -14,7 +19,16 @@ class Category(models.Model):
         return self.name
 
 def products_image_path(instance, filename):
-    return f"products/{instance.user.username}/{filename}"
+    return f"products/{instance.author.username}/{filename}"
+
+class MediaBlob(models.Model):
+    # ContentAddressedStorage 파일의 참조 횟수
+    name = models.CharField(max_length=255, primary_key=True)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count})"
 
 def validation_hashtag(value):
     if not re.match(r"^[0-9a-zA-Z가-힣_]+$", value):
@@ -22,6 +36,8 @@ def validation_hashtag(value):
 
 class HashTag(models.Model):
     name = models.CharField(max_length=50, unique=True, validators=[validation_hashtag])
+    # 해시태그가 연결된 상품 수 (상품 생성/수정/삭제 시 갱신)
+    product_count = models.PositiveIntegerField(default=0, db_index=True)
 
     def __str__(self):
         return f"#{self.name}"
@@ -41,46 +57,223 @@ class Products(models.Model):
     like_user = models.ManyToManyField(
         settings.AUTH_USER_MODEL,
         related_name="like_products",
+        through="ProductLike",  # 좋아요 시각 저장
         blank=True
     )
     hashtags = models.ManyToManyField(HashTag, related_name='products', blank=True)
     views = models.PositiveIntegerField(default=0)
+    # 좋아요 수 (좋아요/취소 시 갱신, 좋아요순 정렬에 사용)
+    like_count = models.PositiveIntegerField(default=0)
     category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='products', blank=True)
 
+    class Meta:
+        # 목록 필터/정렬 조합별 인덱스 (products/filters.py)
+        indexes = [
+            # 최신순 목록 / 해시태그별 목록 keyset 페이지네이션
+            models.Index(fields=["-created_at", "-id"], name="products_created_idx"),
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(quantity__gt=0),
+                name="products_in_stock_created_idx",
+            ),
+            models.Index(fields=["price", "id"], name="products_price_idx"),
+            models.Index(fields=["-like_count", "-id"], name="products_likes_idx"),
+            models.Index(fields=["category", "-created_at", "-id"], name="products_cat_created_idx"),
+            models.Index(fields=["category", "price", "id"], name="products_cat_price_idx"),
+            models.Index(fields=["author", "-created_at", "-id"], name="products_author_created_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
     @property
     def like_user_counter(self):
-        return self.like_user.count()
+        return self.like_count
 
     def view_counter(self):
         self.views += 1
-        self.save()
+        self.save(update_fields=["views"])
         return self.views
 
     def add_like(self, user):
         if self.author == user:
             raise ValidationError("자신의 상품은 좋아요/찜 불가")
-        self.like_user.add(user)
+        with transaction.atomic():
+            _, created = ProductLike.objects.get_or_create(user=user, product=self)
+            if created:
+                Products.objects.filter(pk=self.pk).update(like_count=F("like_count") + 1)
 
     def remove_like(self, user):
         if self.author == user:
             raise ValidationError("자신의 상품은 좋아요/찜 취소 불가.")
-        self.like_user.remove(user)
+        with transaction.atomic():
+            deleted, _ = ProductLike.objects.filter(user=user, product=self).delete()
+            if deleted:
+                Products.objects.filter(pk=self.pk).update(like_count=F("like_count") - 1)
 
     def save(self, *args, **kwargs):
-        # 해시태그 자동 추출
-        hashtags = extract_hashtags(self.content)  # content에서 해시태그 추출
-        hashtag_objects = []
-        
-        # 해시태그 객체가 없으면 생성하여 리스트에 추가
-        for hashtag in hashtags:
-            hashtag_obj, created = HashTag.objects.get_or_create(name=hashtag)
-            hashtag_objects.append(hashtag_obj)
-        
-        # 먼저 객체를 저장
-        super().save(*args, **kwargs)
-        
-        # 그 후에 해시태그 연결
-        self.hashtags.set(hashtag_objects)
\ No newline at end of file
+        update_fields = kwargs.get("update_fields")
+        with transaction.atomic():
+            # 먼저 객체를 저장
+            super().save(*args, **kwargs)
+
+            # 그 후에 해시태그 연결 (content가 저장된 경우만)
+            if update_fields is None or "content" in update_fields:
+                self.sync_hashtags()
+
+    def sync_hashtags(self):
+        # content에서 해시태그 추출 후 변경된 해시태그만 연결/해제
+        names = set(extract_hashtags(self.content))
+        current = {hashtag.name: hashtag for hashtag in self.hashtags.all()}
+
+        removed = [current[name] for name in current.keys() - names]
+        if removed:
+            self.hashtags.remove(*removed)
+            HashTag.objects.filter(pk__in=[h.pk for h in removed]).update(
+                product_count=F("product_count") - 1
+            )
+
+        added = []
+        has_new_hashtag = False
+        for name in names - current.keys():
+            # 해시태그 객체가 없으면 생성
+            hashtag_obj, created = HashTag.objects.get_or_create(name=name)
+            has_new_hashtag = has_new_hashtag or created
+            added.append(hashtag_obj)
+        if added:
+            self.hashtags.add(*added)
+            HashTag.objects.filter(pk__in=[h.pk for h in added]).update(
+                product_count=F("product_count") + 1
+            )
+
+        # 자동완성 인덱스에 사용 횟수 반영
+        def update_index():
+            if has_new_hashtag:
+                # 다른 워커의 인덱스도 새 해시태그를 반영하도록 스냅샷 무효화
+                hashtag_index.invalidate_snapshot()
+            for hashtag in removed:
+                hashtag_index.add(hashtag.name, weight=-1)
+            for hashtag in added:
+                hashtag_index.add(hashtag.name, weight=1)
+
+        transaction.on_commit(update_index)
+
+
+# 좋아요 중간 테이블
+class ProductLike(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="product_likes"
+    )
+    product = models.ForeignKey(Products, on_delete=models.CASCADE, related_name="likes")
+    # 보관 상품 복원 시 원래 좋아요 시각을 유지하도록 default 사용
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    class Meta:
+        unique_together = ("user", "product")  # 중복 좋아요 방지
+        indexes = [
+            # 내가 좋아요한 상품 목록 (좋아요 시각 기준 keyset 페이지네이션)
+            models.Index(fields=["user", "-created_at", "-id"], name="product_like_user_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} likes {self.product}"
+
+    @classmethod
+    def liked_product_ids(cls, user, product_ids):
+        # 페이지 내 상품들의 좋아요 여부를 한 번의 IN 쿼리로 조회
+        if not user.is_authenticated or not product_ids:
+            return set()
+        return set(
+            cls.objects.filter(user=user, product_id__in=product_ids).values_list(
+                "product_id", flat=True
+            )
+        )
+
+
+# 재고 예약 (products/stock.py)
+class Reservation(models.Model):
+    PENDING = "pending"
+    CONFIRMED = "confirmed"
+    RELEASED = "released"
+    STATUS_CHOICES = [
+        (PENDING, "예약"),
+        (CONFIRMED, "구매 확정"),
+        (RELEASED, "만료/취소"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="reservations"
+    )
+    product = models.ForeignKey(Products, on_delete=models.CASCADE, related_name="reservations")
+    quantity = models.PositiveIntegerField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            # 만료된 예약 일괄 해제
+            models.Index(fields=["status", "expires_at"], name="reservation_expiry_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} reserves {self.product} x{self.quantity}"
+
+
+# 보관 상품 (products/archive.py)
+# 오래된 품절 상품을 Products 테이블에서 옮겨 목록 쿼리/인덱스 크기를 줄임
+class ArchivedProduct(models.Model):
+    id = models.BigIntegerField(primary_key=True)  # 원래 상품 id 유지
+    title = models.CharField(max_length=50)
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="archived_products"
+    )
+    content = models.TextField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    product_name = models.CharField(max_length=100)
+    price = models.PositiveIntegerField()
+    quantity = models.PositiveIntegerField()
+    image = models.ImageField(upload_to=products_image_path, blank=True, null=True)
+    views = models.PositiveIntegerField(default=0)
+    like_count = models.PositiveIntegerField(default=0)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='archived_products')
+    # 해시태그 중간 테이블 대신 이름 목록 저장 (복원 시 content에서 다시 연결)
+    hashtag_names = models.JSONField(default=list, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedProductLike(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="archived_product_likes"
+    )
+    product = models.ForeignKey(ArchivedProduct, on_delete=models.CASCADE, related_name="likes")
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ("user", "product")
+
+    def __str__(self):
+        return f"{self.user} likes {self.product} (archived)"
+
+
+def release_hashtags(product_ids):
+    """
+    삭제되는 상품들의 해시태그 상품 수 감소
+    - 감소량이 같은 해시태그끼리 묶어서 UPDATE
+    """
+    rows = (
+        Products.hashtags.through.objects.filter(products_id__in=product_ids)
+        .values("hashtag_id")
+        .annotate(n=Count("id"))
+    )
+    by_count = defaultdict(list)
+    for row in rows:
+        by_count[row["n"]].append(row["hashtag_id"])
+    for n, hashtag_ids in by_count.items():
+        HashTag.objects.filter(pk__in=hashtag_ids).update(
+            product_count=F("product_count") - n
+        )
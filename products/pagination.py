@@ -0,0 +1,106 @@
+import json
+from base64 import b64decode, b64encode
+from collections import namedtuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+# 페이지 경계 항목의 (정렬 키 값, id) 와 이동 방향
+KeysetCursor = namedtuple("KeysetCursor", ["value", "id", "reverse"])
+
+
+class ProductCursorPagination(CursorPagination):
+    """
+    (정렬 키, id) keyset 페이지네이션
+    - 커서에 페이지 경계 항목의 (정렬 키 값, id) 저장
+    - (키, id) 비교로 다음/이전 페이지 조회 (OFFSET 없음, 같은 키 값이 많아도 누락/중복 없음)
+    - ordering 은 방향이 같은 (정렬 키, id) 쌍
+    """
+
+    page_size = 5
+    ordering = ("-created_at", "-id")
+
+    def _parse_ordering(self):
+        key, tiebreaker = self.ordering
+        descending = key.startswith("-")
+        assert tiebreaker == ("-id" if descending else "id"), (
+            "ordering 은 방향이 같은 (정렬 키, id) 쌍이어야 합니다."
+        )
+        return key.lstrip("-"), descending
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.key, descending = self._parse_ordering()
+        self.key_field = queryset.model._meta.get_field(self.key)
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor.reverse
+        # 이전 페이지는 반대 방향으로 조회 후 뒤집음
+        if reverse:
+            descending = not descending
+
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(f"{prefix}{self.key}", f"{prefix}id")
+        if cursor is not None:
+            lookup = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{self.key}__{lookup}": cursor.value})
+                | Q(**{self.key: cursor.value, f"id__{lookup}": cursor.id})
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = results
+        return results
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            data = json.loads(b64decode(encoded.encode("ascii")).decode("utf-8"))
+            return KeysetCursor(
+                value=self.key_field.to_python(data["k"]),
+                id=int(data["i"]),
+                reverse=bool(data.get("r")),
+            )
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, item, reverse=False):
+        value = getattr(item, self.key)
+        # datetime 은 마이크로초까지 유지 (DjangoJSONEncoder 는 밀리초로 자름)
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        data = {"k": value, "i": item.pk}
+        if reverse:
+            data["r"] = 1
+        encoded = b64encode(json.dumps(data).encode("utf-8"))
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded.decode("ascii")
+        )
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
@@ -1,25 +1,49 @@
 from rest_framework import serializers
-from .models import Category, HashTag, Products, extract_hashtags
+from .models import ArchivedProduct, Category, HashTag, Products, ProductLike, Reservation
+
+
+class FieldSelectionMixin:
+    # ?fields= / ?omit= 으로 선택된 필드만 직렬화 (fields=None 이면 전체)
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
 class HashTagSerializer(serializers.ModelSerializer):
     class Meta:
         model = HashTag
         fields = ['id', 'name']  # id와 name을 반환
 
+class HashTagCountSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = HashTag
+        fields = ['id', 'name', 'product_count']
+
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ['id', 'name']  # id와 name을 반환
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(FieldSelectionMixin, serializers.ModelSerializer):
     author = serializers.ReadOnlyField(source='author.username')
     like_user_counter = serializers.ReadOnlyField()
+    is_liked = serializers.SerializerMethodField()
     hashtags = HashTagSerializer(many=True, read_only=True)
     category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.all()) # Post에만 작동 / DB에 간섭
 
+    # 응답 필드 → 조회할 컬럼 (없는 필드는 같은 이름의 컬럼)
+    field_columns = {
+        'author': ('author__username',),
+        'hashtags': (),
+        'like_user_counter': ('like_count',),
+        'is_liked': (),
+    }
+    _field_names = None
+
     class Meta:
         model = Products
-        exclude = ['like_user', 'views']  # 'views'와 'like_user'는 직렬화에서 제외
+        exclude = ['like_user', 'views', 'like_count']  # 'views', 'like_user', 'like_count'는 직렬화에서 제외
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -29,22 +53,68 @@ class ProductSerializer(serializers.ModelSerializer):
         if request and request.method == 'POST':
             self.fields.pop('hashtags', None)
 
+    @classmethod
+    def field_names(cls):
+        if cls._field_names is None:
+            cls._field_names = tuple(cls().fields)
+        return cls._field_names
+
+    @classmethod
+    def select_fields(cls, request, default_omit=()):
+        """
+        응답 필드 선택
+        - ?fields=a,b : 지정한 필드만
+        - ?omit=a,b : 지정한 필드 제외 (?omit= 으로 default_omit 해제)
+        """
+        available = cls.field_names()
+        fields_param = request.query_params.get('fields')
+        omit_param = request.query_params.get('omit')
+
+        if fields_param:
+            requested = {name.strip() for name in fields_param.split(',') if name.strip()}
+            param = 'fields'
+        else:
+            if omit_param is None:
+                requested = set(default_omit)
+            else:
+                requested = {name.strip() for name in omit_param.split(',') if name.strip()}
+            param = 'omit'
+
+        unknown = requested - set(available)
+        if unknown:
+            raise serializers.ValidationError(
+                {param: f"알 수 없는 필드: {', '.join(sorted(unknown))}"}
+            )
+
+        if param == 'fields':
+            selected = requested | {'id'}
+        else:
+            selected = set(available) - requested | {'id'}
+        return [name for name in available if name in selected]
+
+    @classmethod
+    def optimize_queryset(cls, queryset, fields, extra_columns=()):
+        # 선택된 필드에 필요한 컬럼만 조회
+        columns = {'id', 'created_at', *extra_columns}
+        for name in fields:
+            columns.update(cls.field_columns.get(name, (name,)))
+        queryset = queryset.only(*columns)
+        if 'author' in fields:
+            queryset = queryset.select_related('author')
+        if 'hashtags' in fields:
+            queryset = queryset.prefetch_related('hashtags')
+        return queryset
+
+    def get_is_liked(self, obj):
+        # 뷰에서 페이지 단위로 조회한 좋아요 상품 id 목록 사용
+        return obj.pk in self.context.get('liked_ids', ())
+
     def create(self, validated_data):
         # 새로운 상품을 생성할 때 현재 사용자 자동 설정
         validated_data['author'] = self.context['request'].user  # 요청한 사용자가 author로 자동 설정
         validated_data['views'] = 0  # 조회수 초기값 설정 (상품 생성 시 자동으로 0으로 설정)
-        product = super().create(validated_data)
-        
-        # 해시태그 자동 추출 처리
-        hashtags = extract_hashtags(product.content)  # content에서 해시태그 추출
-        hashtag_objects = []
-        for hashtag in hashtags:
-            hashtag_obj, created = HashTag.objects.get_or_create(name=hashtag)
-            hashtag_objects.append(hashtag_obj)
-        product.hashtags.set(hashtag_objects)  # 해시태그 연결
-        product.save()
-
-        return product
+        # 해시태그 자동 추출/연결은 Products.save에서 처리
+        return super().create(validated_data)
 
     def update(self, instance, validated_data):
         # 기존 상품 수정 시 작성자 정보, 해시태그, 조회수, 좋아요는 수정하지 않음
@@ -52,18 +122,71 @@ class ProductSerializer(serializers.ModelSerializer):
         validated_data.pop('hashtags', None)  # 해시태그 수정은 제외
         validated_data.pop('views', None)
         validated_data.pop('like_user', None)
+        old_image = instance.image.name if instance.image else None
+
+        # 변경된 필드만 저장 (좋아요 수 등 다른 요청이 갱신하는 컬럼을 덮어쓰지 않음)
+        # 해시태그 자동 추출/연결은 Products.save에서 처리
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
 
-        # 상품을 업데이트한 후, 해시태그 자동 추출
-        instance = super().update(instance, validated_data)
-        
-        # content에서 해시태그 추출 및 업데이트
-        hashtags = extract_hashtags(instance.content)  # content에서 해시태그 추출
-        hashtag_objects = []
-        for hashtag in hashtags:
-            hashtag_obj, created = HashTag.objects.get_or_create(name=hashtag)
-            hashtag_objects.append(hashtag_obj)
-        
-        instance.hashtags.set(hashtag_objects)  # 해시태그 연결
-        instance.save()
+        # 이미지를 새로 저장/삭제한 경우 이전 이미지 참조 해제
+        # (같은 내용을 다시 올려 이름이 같아도 새 참조가 추가되었으므로 해제)
+        if old_image and 'image' in validated_data:
+            instance.image.storage.delete(old_image)
 
         return instance
+
+
+class ArchivedProductSerializer(FieldSelectionMixin, serializers.ModelSerializer):
+    # 보관된 상품 조회용 (읽기 전용, ProductSerializer 와 같은 응답 형태)
+    author = serializers.ReadOnlyField(source='author.username')
+    like_user_counter = serializers.ReadOnlyField(source='like_count')
+    is_liked = serializers.SerializerMethodField()
+    hashtags = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedProduct
+        exclude = ['views', 'like_count', 'hashtag_names', 'archived_at']
+
+    def get_is_liked(self, obj):
+        return obj.pk in self.context.get('liked_ids', ())
+
+    def get_hashtags(self, obj):
+        # 해시태그는 이름으로 보관되므로 현재 해시태그 객체로 변환
+        hashtags = HashTag.objects.filter(name__in=obj.hashtag_names).order_by('id')
+        return HashTagSerializer(hashtags, many=True).data
+
+
+class ProductLikeSerializer(serializers.ModelSerializer):
+    product = ProductSerializer(read_only=True)
+    liked_at = serializers.DateTimeField(source='created_at', read_only=True)
+
+    class Meta:
+        model = ProductLike
+        fields = ['product', 'liked_at']
+
+
+class ReservationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Reservation
+        fields = ['id', 'product', 'quantity', 'status', 'created_at', 'expires_at']
+        read_only_fields = ['id', 'product', 'status', 'created_at', 'expires_at']
+        extra_kwargs = {'quantity': {'min_value': 1}}
+
+
+class CheckoutItemSerializer(serializers.Serializer):
+    product = serializers.IntegerField()
+    quantity = serializers.IntegerField(min_value=1)
+
+
+class CheckoutSerializer(serializers.Serializer):
+    items = CheckoutItemSerializer(many=True, required=False, default=list)
+    reservations = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list
+    )
+
+    def validate(self, data):
+        if not data['items'] and not data['reservations']:
+            raise serializers.ValidationError("구매할 상품 또는 예약이 필요합니다.")
+        return data
@@ -0,0 +1,23 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, pre_delete
+from django.dispatch import receiver
+
+from .models import ArchivedProduct, Products, release_hashtags
+
+
+# 상품이 어떤 경로로 삭제되든 (상세 삭제, queryset 삭제, 카테고리/사용자 cascade) 집계 정리
+@receiver(pre_delete, sender=Products)
+def release_product_hashtags(sender, instance, **kwargs):
+    # 중간 테이블 행이 지워지기 전에 해시태그 상품 수 감소
+    release_hashtags([instance.pk])
+
+
+@receiver(post_delete, sender=Products)
+@receiver(post_delete, sender=ArchivedProduct)
+def release_product_image(sender, instance, **kwargs):
+    # 커밋 이후 이미지 참조 해제 (마지막 참조일 때만 파일 삭제)
+    # 보관/복원은 이미지를 옮기므로 삭제 전에 image 를 비움
+    if not instance.image:
+        return
+    storage, name = instance.image.storage, instance.image.name
+    transaction.on_commit(lambda: storage.delete(name))
@@ -0,0 +1,137 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Products, Reservation
+
+RESERVATION_TTL = timedelta(minutes=10)  # 예약 유지 시간
+RELEASE_BATCH_SIZE = 500  # 만료 예약 해제 batch 크기
+
+
+class OutOfStockError(ValidationError):
+    def __init__(self, product_id):
+        super().__init__(f"재고 부족: 상품 {product_id}", code="out_of_stock")
+        self.product_id = product_id
+
+
+def _decrement(product_id, quantity):
+    # 조건부 UPDATE 한 번으로 재고 차감 (읽고-수정-쓰기 없음)
+    return Products.objects.filter(pk=product_id, quantity__gte=quantity).update(
+        quantity=F("quantity") - quantity
+    )
+
+
+def decrement_stock(product_id, quantity):
+    if _decrement(product_id, quantity):
+        return
+    if not Products.objects.filter(pk=product_id).exists():
+        raise ValidationError(f"존재하지 않는 상품: {product_id}", code="not_found")
+    # 만료된 예약 재고를 돌려놓고 한 번 더 시도
+    if release_expired_reservations(product_ids=[product_id]) and _decrement(
+        product_id, quantity
+    ):
+        return
+    raise OutOfStockError(product_id)
+
+
+def purchase(items):
+    """
+    여러 상품 구매 (한 트랜잭션)
+    - items : [(product_id, quantity), ...]
+    - 하나라도 재고가 부족하면 전체 취소
+    - 상품 id 순으로 갱신하여 교착 상태 방지
+    """
+    merged = defaultdict(int)
+    for product_id, quantity in items:
+        merged[product_id] += quantity
+
+    with transaction.atomic():
+        for product_id, quantity in sorted(merged.items()):
+            decrement_stock(product_id, quantity)
+
+
+def reserve(user, product_id, quantity, ttl=RESERVATION_TTL):
+    # 재고를 먼저 차감하고 만료 시각이 있는 예약 생성
+    with transaction.atomic():
+        decrement_stock(product_id, quantity)
+        return Reservation.objects.create(
+            user=user,
+            product_id=product_id,
+            quantity=quantity,
+            expires_at=timezone.now() + ttl,
+        )
+
+
+def confirm_reservations(user, reservation_ids):
+    # 만료되지 않은 본인 예약을 구매 확정 (재고는 예약 시 차감됨)
+    reservation_ids = set(reservation_ids)
+    confirmed = Reservation.objects.filter(
+        pk__in=reservation_ids,
+        user=user,
+        status=Reservation.PENDING,
+        expires_at__gt=timezone.now(),
+    ).update(status=Reservation.CONFIRMED)
+    if confirmed != len(reservation_ids):
+        raise ValidationError("만료되었거나 유효하지 않은 예약", code="invalid_reservation")
+
+
+def checkout(user, items=(), reservation_ids=()):
+    # 예약 확정 + 즉시 구매를 한 트랜잭션으로 처리
+    with transaction.atomic():
+        if reservation_ids:
+            confirm_reservations(user, reservation_ids)
+        if items:
+            purchase(items)
+
+
+def _release_pending(reservations, batch_size):
+    # 대기 중인 예약을 batch 단위로 해제하고 재고 반환
+    released = 0
+    while True:
+        with transaction.atomic():
+            pending = reservations.select_for_update(skip_locked=True).filter(
+                status=Reservation.PENDING
+            )
+            batch = list(pending.values_list("pk", "product_id", "quantity")[:batch_size])
+            if not batch:
+                break
+
+            Reservation.objects.filter(pk__in=[pk for pk, _, _ in batch]).update(
+                status=Reservation.RELEASED
+            )
+
+            quantities = defaultdict(int)
+            for _, product_id, quantity in batch:
+                quantities[product_id] += quantity
+            # 반환 수량이 같은 상품끼리 묶어서 UPDATE
+            by_quantity = defaultdict(list)
+            for product_id, quantity in quantities.items():
+                by_quantity[quantity].append(product_id)
+            for quantity, ids in by_quantity.items():
+                Products.objects.filter(pk__in=ids).update(quantity=F("quantity") + quantity)
+
+        released += len(batch)
+        if len(batch) < batch_size:
+            break
+    return released
+
+
+def release_expired_reservations(batch_size=RELEASE_BATCH_SIZE, product_ids=None):
+    """
+    만료된 예약의 재고 반환
+    - batch 단위 짧은 트랜잭션
+    - 다른 작업자가 잠근 예약은 건너뜀 (skip_locked)
+    """
+    expired = Reservation.objects.filter(expires_at__lte=timezone.now())
+    if product_ids is not None:
+        expired = expired.filter(product_id__in=product_ids)
+    return _release_pending(expired, batch_size)
+
+
+def release_user_reservations(user, batch_size=RELEASE_BATCH_SIZE):
+    # 탈퇴한 사용자의 예약은 만료 전이라도 해제 (예약 행이 사용자와 함께 삭제되기 전에 재고 반환)
+    return _release_pending(Reservation.objects.filter(user=user), batch_size)
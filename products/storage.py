@@ -0,0 +1,99 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    파일 내용의 해시값으로 저장하는 스토리지
+    - 동일한 파일은 한 번만 저장하고 참조 횟수(MediaBlob)로 관리
+    - 업로드 파일은 chunk 단위로 해시 계산하며 임시 파일에 기록
+    - 저장 경로: cas/<2>/<2>/<sha256><확장자>
+    """
+
+    prefix = "cas"
+    chunk_size = 64 * 1024
+
+    def is_content_addressed(self, name):
+        return bool(name) and name.startswith(f"{self.prefix}/")
+
+    def get_available_name(self, name, max_length=None):
+        # 실제 이름은 내용 해시로 결정되므로 중복 이름 탐색 불필요
+        return name
+
+    def _save(self, name, content):
+        tmp_dir = self.path(os.path.join(self.prefix, "tmp"))
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks(chunk_size=self.chunk_size):
+                    digest.update(chunk)
+                    tmp_file.write(chunk)
+
+            hexdigest = digest.hexdigest()
+            ext = os.path.splitext(name)[1].lower()
+            cas_name = (
+                f"{self.prefix}/{hexdigest[:2]}/{hexdigest[2:4]}/{hexdigest}{ext}"
+            )
+            full_path = self.path(cas_name)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            if self.file_permissions_mode is not None:
+                os.chmod(tmp_path, self.file_permissions_mode)
+
+            # 참조 행을 잠근 상태에서 파일 교체
+            # - 같은 내용이어도 항상 교체 (동시에 진행 중인 마지막 참조 삭제로 파일이 지워졌을 수 있음)
+            # - delete 는 같은 행을 잠근 뒤 파일을 지우므로 교체와 삭제가 겹치지 않음
+            with transaction.atomic():
+                self._acquire(cas_name)
+                os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return cas_name
+
+    def _acquire(self, name):
+        from .models import MediaBlob
+
+        updated = MediaBlob.objects.filter(name=name).update(
+            ref_count=F("ref_count") + 1
+        )
+        if updated:
+            return
+        try:
+            with transaction.atomic():
+                MediaBlob.objects.create(name=name, ref_count=1)
+        except IntegrityError:
+            # 동시에 같은 파일이 업로드된 경우
+            MediaBlob.objects.filter(name=name).update(
+                ref_count=F("ref_count") + 1
+            )
+
+    def delete(self, name):
+        if not self.is_content_addressed(name):
+            return super().delete(name)
+
+        from .models import MediaBlob
+
+        with transaction.atomic():
+            blob = MediaBlob.objects.select_for_update().filter(name=name).first()
+            if blob is None:
+                return
+            if blob.ref_count > 1:
+                MediaBlob.objects.filter(pk=blob.pk).update(
+                    ref_count=F("ref_count") - 1
+                )
+                return
+            # 마지막 참조 : 행 잠금을 유지한 채 행과 파일 삭제
+            blob.delete()
+            super().delete(name)
@@ -1,3 +1,788 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import OperationalError, connection
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import User
+from PIL import Image
+from spartamarket.middleware import CompressionMiddleware, brotli
+from rest_framework.test import APIClient
+
+from .models import (
+    ArchivedProduct,
+    Category,
+    HashTag,
+    MediaBlob,
+    ProductLike,
+    Products,
+    Reservation,
+)
+from .hashtag_index import TOP_K, HashTagIndex
+from .storage import ContentAddressedStorage
+from . import archive, stock
+
+
+class StockConcurrencyTest(TransactionTestCase):
+    """
+    동시 구매 test
+    - 재고보다 많은 구매자가 동시에 구매해도 재고 이상 판매되지 않는지 확인
+    - 처리량 측정은 benchmarks/checkout.py
+    """
+
+    buyers = 20
+
+    def setUp(self):
+        self.seller = User.objects.create_user(
+            email="seller@example.com", password="qwer1234!@", username="seller"
+        )
+        self.category = Category.objects.create(name="test")
+
+    def create_product(self, quantity):
+        return Products.objects.create(
+            title="상품",
+            author=self.seller,
+            content="",
+            product_name="상품",
+            price=1000,
+            quantity=quantity,
+            category=self.category,
+        )
+
+    def run_buyers(self, items):
+        results = {"sold": 0, "out_of_stock": 0}
+        lock = threading.Lock()
+        start_event = threading.Event()
+
+        def buy():
+            start_event.wait()
+            try:
+                while True:
+                    try:
+                        stock.purchase(items)
+                        outcome = "sold"
+                    except stock.OutOfStockError:
+                        outcome = "out_of_stock"
+                    except OperationalError:
+                        # SQLite 테스트 DB 쓰기 잠금 : 잠시 후 재시도
+                        time.sleep(random.uniform(0, 0.005))
+                        continue
+                    break
+                with lock:
+                    results[outcome] += 1
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=buy) for _ in range(self.buyers)]
+        for thread in threads:
+            thread.start()
+        start_event.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_no_oversell(self):
+        product = self.create_product(quantity=10)
+
+        results = self.run_buyers([(product.pk, 1)])
+
+        product.refresh_from_db()
+        self.assertEqual(product.quantity, 0)
+        self.assertEqual(results["sold"], 10)
+        self.assertEqual(results["out_of_stock"], self.buyers - 10)
+
+    def test_multi_item_checkout_is_atomic(self):
+        # 두 번째 상품이 먼저 품절 (4회 구매 후 1개 남음)
+        # 이후 구매는 첫 번째 상품(id 순으로 먼저 차감)을 차감한 뒤 실패하므로
+        # 트랜잭션이 취소되어야 첫 번째 상품 재고가 1개로 유지됨
+        first = self.create_product(quantity=5)
+        second = self.create_product(quantity=9)
+
+        results = self.run_buyers([(second.pk, 2), (first.pk, 1)])
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(results["sold"], 4)
+        self.assertEqual(first.quantity, 1)
+        self.assertEqual(second.quantity, 1)
+
+    def test_reservation_expiry_releases_stock(self):
+        product = self.create_product(quantity=3)
+        buyer = User.objects.create_user(
+            email="buyer@example.com", password="qwer1234!@", username="buyer"
+        )
+
+        reservation = stock.reserve(buyer, product.pk, 3, ttl=timedelta(seconds=-1))
+        with self.assertRaises(ValidationError):
+            stock.confirm_reservations(buyer, [reservation.pk])
+
+        released = stock.release_expired_reservations()
+
+        product.refresh_from_db()
+        self.assertEqual(released, 1)
+        self.assertEqual(product.quantity, 3)
+
+
+class ProductArchiveTest(TestCase):
+    def setUp(self):
+        self.seller = User.objects.create_user(
+            email="seller@example.com", password="qwer1234!@", username="seller"
+        )
+        self.buyer = User.objects.create_user(
+            email="buyer@example.com", password="qwer1234!@", username="buyer"
+        )
+        self.category = Category.objects.create(name="test")
+
+    def create_product(self, quantity, days_ago):
+        product = Products.objects.create(
+            title="상품",
+            author=self.seller,
+            content="#빈티지 #카메라",
+            product_name="상품",
+            price=1000,
+            quantity=quantity,
+            category=self.category,
+        )
+        Products.objects.filter(pk=product.pk).update(
+            updated_at=timezone.now() - timedelta(days=days_ago)
+        )
+        return product
+
+    def test_archive_and_restore(self):
+        stale = self.create_product(quantity=0, days_ago=100)
+        stale.add_like(self.buyer)
+        image = "cas/aa/bb/image.png"
+        Products.objects.filter(pk=stale.pk).update(image=image)
+        in_stock = self.create_product(quantity=1, days_ago=100)
+        recent = self.create_product(quantity=0, days_ago=1)
+
+        # 이미지는 옮겨질 뿐이므로 참조 해제되지 않아야 함
+        release_image = mock.patch.object(ContentAddressedStorage, "delete")
+        with release_image as delete, self.captureOnCommitCallbacks(execute=True):
+            archived = archive.archive_products(
+                INACTIVE_DAYS=90, BATCH_SIZE=1, BATCH_PAUSE=0
+            )
+        delete.assert_not_called()
+
+        self.assertEqual(archived, 1)
+        self.assertFalse(Products.objects.filter(pk=stale.pk).exists())
+        self.assertEqual(
+            set(Products.objects.values_list("pk", flat=True)), {in_stock.pk, recent.pk}
+        )
+        self.assertEqual(HashTag.objects.get(name="빈티지").product_count, 2)
+
+        live = self.client.get(f"/products/{recent.pk}/").data
+        client = APIClient()
+        client.force_authenticate(self.buyer)
+        response = client.get(f"/products/{stale.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["archived"])
+        product = response.data["product"]
+        # 보관된 상품도 일반 상품과 같은 응답 형태
+        self.assertEqual(set(product), set(live["product"]))
+        self.assertEqual(product["like_user_counter"], 1)
+        self.assertTrue(product["is_liked"])
+        self.assertEqual(
+            product["hashtags"],
+            [{"id": tag.pk, "name": tag.name} for tag in HashTag.objects.order_by("id")],
+        )
+        self.assertEqual(
+            set(client.get(f"/products/{stale.pk}/?fields=id,is_liked").data["product"]),
+            {"id", "is_liked"},
+        )
+
+        with release_image as delete, self.captureOnCommitCallbacks(execute=True):
+            restored = archive.restore_product(stale.pk)
+        delete.assert_not_called()
+
+        self.assertFalse(ArchivedProduct.objects.exists())
+        self.assertEqual(restored.image.name, image)
+        self.assertEqual(restored.created_at, stale.created_at)
+        self.assertEqual(Products.objects.get(pk=stale.pk).like_count, 1)
+        self.assertEqual(HashTag.objects.get(name="빈티지").product_count, 3)
+        self.assertEqual(archive.archive_products(INACTIVE_DAYS=90), 0)
+
+    def test_pending_reservation_is_not_archived(self):
+        product = self.create_product(quantity=0, days_ago=100)
+        Reservation.objects.create(
+            user=self.buyer, product=product, quantity=1, expires_at=timezone.now()
+        )
+
+        self.assertEqual(archive.archive_products(INACTIVE_DAYS=90), 0)
+
+
+class ProductCursorPaginationTest(TestCase):
+    count = 23
+
+    def setUp(self):
+        seller = User.objects.create_user(
+            email="seller@example.com", password="qwer1234!@", username="seller"
+        )
+        category = Category.objects.create(name="test")
+        # 정렬 키(가격, 좋아요 수, 등록 시각)가 모두 같은 상품
+        Products.objects.bulk_create(
+            Products(
+                title="상품",
+                author=seller,
+                content="",
+                product_name="상품",
+                price=1000,
+                quantity=1,
+                category=category,
+            )
+            for _ in range(self.count)
+        )
+        Products.objects.update(created_at=timezone.now())
+
+    def walk(self, url, link="next"):
+        ids = []
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data[link]
+            pages += 1
+            self.assertLessEqual(pages, self.count)
+        return ids, response
+
+    def test_duplicate_keys_are_paged_without_gaps_or_repeats(self):
+        all_ids = sorted(Products.objects.values_list("pk", flat=True))
+        for sort in ("likes", "price", "-price", "newest"):
+            with self.subTest(sort=sort):
+                ids, _ = self.walk(f"/products/?sort={sort}&fields=id")
+                self.assertEqual(len(ids), self.count)
+                self.assertEqual(sorted(ids), all_ids)
+                expected = all_ids if sort == "price" else all_ids[::-1]
+                self.assertEqual(ids, expected)
+
+    def test_previous_link_returns_previous_page(self):
+        first = self.client.get("/products/?sort=likes&fields=id").data
+        second = self.client.get(first["next"]).data
+        self.assertIsNone(first["previous"])
+
+        back = self.client.get(second["previous"]).data
+
+        self.assertEqual(back["results"], first["results"])
+        self.assertEqual(back["next"], first["next"])
+        self.assertIsNone(back["previous"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/products/?sort=price&cursor=invalid")
+        self.assertEqual(response.status_code, 404)
+
+
+class ProductLikeListTest(TestCase):
+    def setUp(self):
+        self.seller = User.objects.create_user(
+            email="seller@example.com", password="qwer1234!@", username="seller"
+        )
+        self.buyer = User.objects.create_user(
+            email="buyer@example.com", password="qwer1234!@", username="buyer"
+        )
+        self.category = Category.objects.create(name="test")
+        self.client = APIClient()
+        self.client.force_authenticate(self.buyer)
+
+    def create_products(self, count, author=None):
+        return [
+            Products.objects.create(
+                title=f"상품 {i}",
+                author=author or self.seller,
+                content="#카메라",
+                product_name="상품",
+                price=1000,
+                quantity=1,
+                category=self.category,
+            )
+            for i in range(count)
+        ]
+
+    def like(self, products):
+        # 좋아요 시각을 상품 등록 순서와 다르게 지정 (나중 인덱스일수록 오래된 좋아요)
+        now = timezone.now()
+        for i, product in enumerate(products):
+            product.add_like(self.buyer)
+            ProductLike.objects.filter(user=self.buyer, product=product).update(
+                created_at=now - timedelta(minutes=i)
+            )
+
+    def walk(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(item["product"]["id"] for item in response.data["results"])
+            url = response.data["next"]
+        return ids, response
+
+    def test_ordered_by_like_time_across_pages(self):
+        products = self.create_products(7)
+        liked = products[3:] + products[:3]
+        self.like(liked)
+
+        ids, last = self.walk("/products/likes/")
+
+        self.assertEqual(ids, [product.pk for product in liked])
+        self.assertIsNotNone(last.data["previous"])
+        first = self.client.get(last.data["previous"]).data
+        self.assertEqual([item["product"]["id"] for item in first["results"]], ids[:5])
+        self.assertTrue(
+            all(item["product"]["is_liked"] for item in last.data["results"])
+        )
+
+    def test_hides_products_of_resigned_authors(self):
+        resigned = User.objects.create_user(
+            email="resigned@example.com", password="qwer1234!@", username="resigned"
+        )
+        visible = self.create_products(1)
+        hidden = self.create_products(1, author=resigned)
+        self.like(visible + hidden)
+        User.objects.filter(pk=resigned.pk).update(is_active=False)
+
+        ids, _ = self.walk("/products/likes/")
+
+        self.assertEqual(ids, [visible[0].pk])
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        self.like(self.create_products(2))
+        with CaptureQueriesContext(connection) as small_page:
+            self.assertEqual(len(self.client.get("/products/likes/").data["results"]), 2)
+
+        self.like(self.create_products(3))
+        with self.assertNumQueries(len(small_page)):
+            self.assertEqual(len(self.client.get("/products/likes/").data["results"]), 5)
+
+    def test_is_liked_is_fetched_in_one_query(self):
+        products = self.create_products(5)
+        self.like(products[:2])
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/products/?fields=id,is_liked")
+
+        self.assertEqual(
+            {item["id"]: item["is_liked"] for item in response.data["results"]},
+            {product.pk: product in products[:2] for product in products},
+        )
+        like_queries = [
+            query["sql"] for query in context.captured_queries
+            if "products_productlike" in query["sql"]
+        ]
+        self.assertEqual(len(like_queries), 1)
+        self.assertIn(" IN (", like_queries[0])
+
+        # 다른 페이지도 같은 쿼리 수 (상품마다 좋아요 여부를 조회하지 않음)
+        self.create_products(5)
+        with self.assertNumQueries(len(context)):
+            self.client.get("/products/?fields=id,is_liked&page=2")
+
+
+class ProductFilterTest(TestCase):
+    def setUp(self):
+        self.seller = User.objects.create_user(
+            email="seller@example.com", password="qwer1234!@", username="seller"
+        )
+        self.category = Category.objects.create(name="test")
+        self.other_category = Category.objects.create(name="other")
+        self.cheap = self.create_product(price=1000, quantity=0, content="#카메라")
+        self.middle = self.create_product(price=2000, quantity=3)
+        self.expensive = self.create_product(
+            price=3000, quantity=1, category=self.other_category
+        )
+
+    def create_product(self, price, quantity, content="", category=None):
+        return Products.objects.create(
+            title="상품",
+            author=self.seller,
+            content=content,
+            product_name="상품",
+            price=price,
+            quantity=quantity,
+            category=category or self.category,
+        )
+
+    def get_ids(self, query):
+        response = self.client.get(f"/products/?{query}&fields=id")
+        self.assertEqual(response.status_code, 200, response.data)
+        return [item["id"] for item in response.data["results"]]
+
+    def test_filters_and_sorts(self):
+        cases = {
+            "in_stock=true": [self.expensive.pk, self.middle.pk],
+            "in_stock=false&sort=price": [self.cheap.pk, self.middle.pk, self.expensive.pk],
+            f"category={self.category.pk}&sort=-price": [self.middle.pk, self.cheap.pk],
+            "min_price=1500&max_price=2500&sort=price": [self.middle.pk],
+            "author=seller": [self.expensive.pk, self.middle.pk, self.cheap.pk],
+            "author=unknown": [],
+            "tag=%23카메라": [self.cheap.pk],
+            "created_after=2000-01-01": [self.expensive.pk, self.middle.pk, self.cheap.pk],
+            "created_before=2000-01-01": [],
+        }
+        for query, expected in cases.items():
+            with self.subTest(query=query):
+                self.assertEqual(self.get_ids(query), expected)
+
+    def test_unindexed_combinations_are_rejected(self):
+        queries = (
+            "in_stock=true&sort=likes",
+            "in_stock=true&sort=-price",
+            "in_stock=true&sort=price",
+            "in_stock=true&min_price=1000&sort=price",
+            f"category={self.category.pk}&author=seller",
+            f"category={self.category.pk}&sort=likes",
+            "author=seller&sort=price",
+            "tag=카메라&sort=likes",
+            "min_price=1000",
+            "created_after=2000-01-01&sort=price",
+        )
+        for query in queries:
+            with self.subTest(query=query):
+                response = self.client.get(f"/products/?{query}")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("detail", response.data)
+
+    def test_invalid_values_are_rejected(self):
+        cases = {
+            "sort=oldest": "sort",
+            "min_price=abc&sort=price": "min_price",
+            "max_price=-1&sort=price": "max_price",
+            "category=abc": "category",
+            "in_stock=yes": "in_stock",
+            "created_after=yesterday": "created_after",
+            "created_before=2024-13-01": "created_before",
+        }
+        for query, field in cases.items():
+            with self.subTest(query=query):
+                response = self.client.get(f"/products/?{query}")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(field, response.data)
+
+
+class CompressionMiddlewareTest(SimpleTestCase):
+    body = json.dumps([{"title": "상품", "content": "설명 " * 20}] * 20).encode()
+
+    def compress(self, accept_encoding=None, body=None, content_type="application/json"):
+        def get_response(request):
+            response = HttpResponse(body or self.body, content_type=content_type)
+            response.headers["ETag"] = '"abc"'
+            return response
+
+        headers = {"HTTP_ACCEPT_ENCODING": accept_encoding} if accept_encoding else {}
+        request = RequestFactory().get("/products/", **headers)
+        return CompressionMiddleware(get_response)(request)
+
+    def test_encoding_negotiation(self):
+        cases = {
+            "gzip, br": "br" if brotli else "gzip",
+            "gzip;q=1.0, br;q=0.5": "gzip",
+            "br;q=0, gzip": "gzip",
+            "GZIP": "gzip",
+            "deflate, identity": None,
+            None: None,
+        }
+        for accept_encoding, expected in cases.items():
+            with self.subTest(accept_encoding=accept_encoding):
+                response = self.compress(accept_encoding)
+                self.assertEqual(response.get("Content-Encoding"), expected)
+                self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_compressed_body_and_headers(self):
+        decompressors = {"gzip": gzip.decompress}
+        if brotli is not None:
+            decompressors["br"] = brotli.decompress
+        for encoding, decompress in decompressors.items():
+            with self.subTest(encoding=encoding):
+                response = self.compress(encoding)
+                self.assertEqual(decompress(response.content), self.body)
+                self.assertEqual(response["Content-Length"], str(len(response.content)))
+                # 압축된 표현은 바이트가 달라지므로 약한 ETag
+                self.assertEqual(response["ETag"], 'W/"abc"')
+
+    def test_gzip_only_without_brotli(self):
+        with mock.patch("spartamarket.middleware.brotli", None):
+            self.assertIsNone(self.compress("br").get("Content-Encoding"))
+            self.assertEqual(self.compress("br, gzip")["Content-Encoding"], "gzip")
+
+    def test_small_or_binary_responses_are_not_compressed(self):
+        for response in (
+            self.compress("br, gzip", body=b'{"detail": "ok"}'),
+            self.compress("br, gzip", content_type="image/png"),
+        ):
+            self.assertFalse(response.has_header("Content-Encoding"))
+            self.assertFalse(response.has_header("Vary"))
+            self.assertEqual(response["ETag"], '"abc"')
+
+
+class HealthCheckMiddlewareTest(TestCase):
+    # 인증/Host 검사 이전에 응답하므로 토큰 없이, 허용되지 않은 Host 로도 접근 가능
+    headers = {"HTTP_HOST": "10.0.0.1:8000"}
+
+    def test_liveness_does_not_query_database(self):
+        for path in ("/healthz", "/healthz/"):
+            with self.subTest(path=path), self.assertNumQueries(0):
+                response = self.client.get(path, **self.headers)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_readiness_checks_database_and_cache(self):
+        for path in ("/readyz", "/readyz/"):
+            with self.subTest(path=path):
+                response = self.client.get(path, **self.headers)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.json(),
+                    {"status": "ok", "checks": {"db:default": "ok", "cache": "ok"}},
+                )
+
+    def test_readiness_fails_when_database_is_down(self):
+        with mock.patch.object(connection, "cursor", side_effect=OperationalError):
+            response = self.client.get("/readyz", **self.headers)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["status"], "unavailable")
+        self.assertEqual(response.json()["checks"]["db:default"], "error")
+
+    def test_readiness_fails_when_cache_is_down(self):
+        with mock.patch("spartamarket.middleware.cache") as cache:
+            cache.set.side_effect = ConnectionError
+            response = self.client.get("/readyz", **self.headers)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["checks"]["cache"], "error")
+
+    def test_other_paths_are_not_intercepted(self):
+        self.assertEqual(self.client.get("/healthz/extra").status_code, 404)
+        # 일반 경로는 Host 검사를 거침
+        self.assertEqual(self.client.get("/products/", **self.headers).status_code, 400)
+
+
+class ProductFieldSelectionTest(TestCase):
+    def setUp(self):
+        seller = User.objects.create_user(
+            email="seller@example.com", password="qwer1234!@", username="seller"
+        )
+        self.product = Products.objects.create(
+            title="상품",
+            author=seller,
+            content="상품 설명 #카메라",
+            product_name="상품",
+            price=1000,
+            quantity=1,
+            category=Category.objects.create(name="test"),
+        )
+
+    def get_fields(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.data)
+        results = response.data.get("results")
+        return set(results[0] if results is not None else response.data["product"])
+
+    def test_list_omits_content_by_default(self):
+        fields = self.get_fields("/products/")
+        self.assertNotIn("content", fields)
+        self.assertIn("hashtags", fields)
+        # 상세 조회는 content 포함
+        self.assertIn("content", self.get_fields(f"/products/{self.product.pk}/"))
+
+    def test_omit_param_overrides_default(self):
+        self.assertIn("content", self.get_fields("/products/?omit="))
+
+        fields = self.get_fields("/products/?omit=hashtags")
+        self.assertIn("content", fields)
+        self.assertNotIn("hashtags", fields)
+
+        self.assertEqual(self.get_fields("/products/?fields=content"), {"id", "content"})
+
+    def test_unknown_field_is_rejected(self):
+        for param in ("omit", "fields"):
+            with self.subTest(param=param):
+                response = self.client.get(f"/products/?{param}=password")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(param, response.data)
+
+
+def png_file(name="image.png", color="red"):
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), color).save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class ContentAddressedStorageTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.storage = ContentAddressedStorage(location=self.media_root)
+
+    def ref_count(self, name):
+        blob = MediaBlob.objects.filter(name=name).first()
+        return blob.ref_count if blob else 0
+
+    def test_same_content_is_stored_once(self):
+        first = self.storage.save("a.png", ContentFile(b"same"))
+        second = self.storage.save("b.png", ContentFile(b"same"))
+        other = self.storage.save("c.png", ContentFile(b"other"))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertTrue(first.startswith("cas/"))
+        self.assertEqual(self.ref_count(first), 2)
+        self.assertEqual(self.ref_count(other), 1)
+
+    def test_file_is_deleted_with_last_reference(self):
+        name = self.storage.save("a.png", ContentFile(b"same"))
+        self.storage.save("b.png", ContentFile(b"same"))
+
+        self.storage.delete(name)
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(self.ref_count(name), 1)
+
+        self.storage.delete(name)
+        self.assertFalse(self.storage.exists(name))
+        self.assertFalse(MediaBlob.objects.filter(name=name).exists())
+
+    def test_reupload_replaces_missing_file(self):
+        # 마지막 참조 삭제와 겹쳐 파일이 지워진 뒤 같은 내용이 업로드된 경우
+        name = self.storage.save("a.png", ContentFile(b"same"))
+        os.remove(self.storage.path(name))
+
+        self.assertEqual(self.storage.save("b.png", ContentFile(b"same")), name)
+        self.assertTrue(self.storage.exists(name))
+        with self.storage.open(name) as f:
+            self.assertEqual(f.read(), b"same")
+        self.assertFalse(os.listdir(self.storage.path("cas/tmp")))
+
+    def test_reupload_same_image_then_delete_product(self):
+        seller = User.objects.create_user(
+            email="seller@example.com", password="qwer1234!@", username="seller"
+        )
+        category = Category.objects.create(name="test")
+        client = APIClient()
+        client.force_authenticate(seller)
+
+        response = client.post(
+            "/products/",
+            {
+                "title": "상품",
+                "content": "상품 설명",
+                "product_name": "상품",
+                "price": 1000,
+                "quantity": 1,
+                "category": category.pk,
+                "image": png_file(),
+            },
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 201)
+        product = Products.objects.get(pk=response.data["id"])
+        name = product.image.name
+
+        response = client.put(
+            f"/products/{product.pk}/", {"image": png_file()}, format="multipart"
+        )
+        self.assertEqual(response.status_code, 200)
+        product.refresh_from_db()
+        self.assertEqual(product.image.name, name)
+        self.assertEqual(self.ref_count(name), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.delete(f"/products/{product.pk}/")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.ref_count(name), 0)
+        self.assertFalse(os.path.exists(os.path.join(self.media_root, name)))
+
+    def test_category_delete_releases_hashtags_and_images(self):
+        seller = User.objects.create_user(
+            email="seller@example.com", password="qwer1234!@", username="seller"
+        )
+        category = Category.objects.create(name="test")
+        other = Category.objects.create(name="other")
+        fields = dict(title="상품", author=seller, product_name="상품", price=1000, quantity=0)
+        product = Products.objects.create(content="#shoes", category=category, **fields)
+        Products.objects.create(content="#shoes", category=other, **fields)
+        product.image.save("a.png", ContentFile(b"image"), save=True)
+        archived_image = self.storage.save("b.png", ContentFile(b"archived"))
+        ArchivedProduct.objects.create(
+            id=1000,
+            image=archived_image,
+            category=category,
+            content="",
+            created_at=timezone.now(),
+            updated_at=timezone.now(),
+            **fields,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category.delete()
+
+        self.assertEqual(HashTag.objects.get(name="shoes").product_count, 1)
+        self.assertFalse(MediaBlob.objects.exists())
+        self.assertFalse(self.storage.exists(product.image.name))
+        self.assertFalse(self.storage.exists(archived_image))
+
+    def test_media_is_served_with_immutable_cache_headers(self):
+        name = self.storage.save("a.png", ContentFile(b"same"))
+
+        response = self.client.get(f"/media/{name}")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response["Cache-Control"])
+        etag = response["ETag"]
+
+        response = self.client.get(f"/media/{name}", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+
+class HashTagIndexTest(SimpleTestCase):
+    def brute_force(self, weights, prefix, limit):
+        matches = sorted(
+            (name for name in weights if name.startswith(prefix)),
+            key=lambda name: (-weights[name], name),
+        )
+        return [{"name": name, "product_count": weights[name]} for name in matches[:limit]]
+
+    def test_suggest_matches_full_scan_after_updates(self):
+        rng = random.Random(0)
+        alphabet = "ab가나"
+
+        def random_name():
+            return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+
+        weights = {random_name(): rng.randint(0, 5) for _ in range(150)}
+        index = HashTagIndex()
+        index._load(list(weights.items()))
+
+        for _ in range(500):
+            name = rng.choice(list(weights)) if rng.random() < 0.8 else random_name()
+            weight = rng.choice((1, -1))
+            index.add(name, weight)
+            weights[name] = max(0, weights.get(name, 0) + weight)
+
+            prefix = random_name()[: rng.randint(1, 3)]
+            limit = rng.choice((1, 5, TOP_K, TOP_K + 5))
+            self.assertEqual(
+                index.suggest(prefix, limit), self.brute_force(weights, prefix, limit)
+            )
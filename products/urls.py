@@ -1,10 +1,25 @@
 from django.urls import path
-from .views import ProductListCreateView, ProductDetailView, ProductLikeView, CategoryListView
+from .views import (
+    ProductListCreateView,
+    ProductDetailView,
+    ProductLikeView,
+    ProductLikeListView,
+    ProductReserveView,
+    CheckoutView,
+    CategoryListView,
+    HashTagAutocompleteView,
+    TopHashTagListView,
+)
 
 app_name = "products"
 urlpatterns = [
     path('', ProductListCreateView.as_view(), name='products'),
     path('<int:pk>/', ProductDetailView.as_view(), name='detail'),
     path('<int:pk>/like/', ProductLikeView.as_view(), name='like'),
+    path('likes/', ProductLikeListView.as_view(), name='like-list'),
+    path('<int:pk>/reserve/', ProductReserveView.as_view(), name='reserve'),
+    path('checkout/', CheckoutView.as_view(), name='checkout'),
     path('categories/', CategoryListView.as_view(), name='category-list'),
+    path('hashtags/top/', TopHashTagListView.as_view(), name='hashtag-top'),
+    path('hashtags/autocomplete/', HashTagAutocompleteView.as_view(), name='hashtag-autocomplete'),
 ]
\ No newline at end of file
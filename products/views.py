@@ -3,27 +3,85 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from django.shortcuts import get_object_or_404  # 추가: get_object_or_404 임포트
-from .models import Products, Category
-from .serializers import ProductSerializer, CategorySerializer
-from drf_spectacular.utils import extend_schema
+from .models import ArchivedProduct, ArchivedProductLike, Products, Category, HashTag, ProductLike
+from .hashtag_index import hashtag_index
+from .filters import ProductFilter
+from .pagination import ProductCursorPagination
+from .serializers import (
+    ProductSerializer,
+    ArchivedProductSerializer,
+    ProductLikeSerializer,
+    CategorySerializer,
+    HashTagCountSerializer,
+    ReservationSerializer,
+    CheckoutSerializer,
+)
+from . import stock
+from django.core.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
 
 
+def visible_products():
+    # 탈퇴 처리 중인(비활성) 사용자의 상품은 삭제 전까지 숨김
+    return Products.objects.filter(author__is_active=True)
+
+
+def liked_ids_context(request, products):
+    # 상품 목록의 좋아요 여부를 한 번에 조회하여 serializer context로 전달
+    product_ids = [product.pk for product in products]
+    return {"liked_ids": ProductLike.liked_product_ids(request.user, product_ids)}
+
+
 class ProductListCreateView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]  # 인증된 사용자만 접근 가능
-    
+    # 목록에서는 기본적으로 상품 설명 제외 (?omit= 으로 포함 가능)
+    default_omit = ("content",)
+
     def get(self, request):
+        fields = ProductSerializer.select_fields(request, self.default_omit)
+
+        product_filter = ProductFilter(request.query_params)
+        if product_filter.is_active:
+            return self.get_filtered(request, product_filter, fields)
+
         # 모든 상품 목록 조회
-        products = Products.objects.all().order_by("-created_at")
+        products = ProductSerializer.optimize_queryset(
+            visible_products(), fields
+        ).order_by("-created_at")
 
         paginator = PageNumberPagination()
         paginator.page_size = 5
         paginated_products = paginator.paginate_queryset(products, request)
 
-        serializer = ProductSerializer(paginated_products, many=True)
+        serializer = ProductSerializer(
+            paginated_products,
+            many=True,
+            fields=fields,
+            context=liked_ids_context(request, paginated_products),
+        )
         # return Response(serializer.data)
         return paginator.get_paginated_response(serializer.data)
 
+    def get_filtered(self, request, product_filter, fields):
+        # 필터/정렬/해시태그별 상품 목록 (keyset 페이지네이션)
+        products = product_filter.filter_queryset(visible_products())
+        ordering = product_filter.ordering
+        products = ProductSerializer.optimize_queryset(
+            products, fields, extra_columns=[name.lstrip("-") for name in ordering]
+        )
+
+        paginator = ProductCursorPagination()
+        paginator.ordering = ordering
+        paginated_products = paginator.paginate_queryset(products, request)
+
+        serializer = ProductSerializer(
+            paginated_products,
+            many=True,
+            fields=fields,
+            context=liked_ids_context(request, paginated_products),
+        )
+        return paginator.get_paginated_response(serializer.data)
+
     def post(self, request):
         # 새로운 상품 생성
         serializer = ProductSerializer(data=request.data, context={"request": request})
@@ -38,14 +96,42 @@ class ProductDetailView(APIView):
 
     def get(self, request, pk):
         # 특정 상품 조회 및 조회수 증가
-        product = get_object_or_404(Products, pk=pk)  # get_object_or_404 사용
+        fields = ProductSerializer.select_fields(request)
+        products = ProductSerializer.optimize_queryset(
+            visible_products(), fields, extra_columns=("views",)
+        )
+        product = products.filter(pk=pk).first()
+        if product is None:
+            return self.get_archived(request, pk, fields)
 
         # 조회수 증가
         views = product.view_counter()
 
         # 상품 정보를 반환
-        serializer = ProductSerializer(product)
-        return Response({"product": serializer.data, "views": views})
+        serializer = ProductSerializer(
+            product, fields=fields, context=liked_ids_context(request, [product])
+        )
+        return Response({"product": serializer.data, "views": views, "archived": False})
+
+    def get_archived(self, request, pk, fields):
+        # 보관된 상품은 보관 테이블에서 조회 (조회수 증가 없음)
+        archived = get_object_or_404(
+            ArchivedProduct.objects.filter(author__is_active=True).select_related("author"),
+            pk=pk,
+        )
+        liked_ids = set()
+        if request.user.is_authenticated:
+            liked_ids = set(
+                ArchivedProductLike.objects.filter(
+                    user=request.user, product=archived
+                ).values_list("product_id", flat=True)
+            )
+        serializer = ArchivedProductSerializer(
+            archived, fields=fields, context={"liked_ids": liked_ids}
+        )
+        return Response(
+            {"product": serializer.data, "views": archived.views, "archived": True}
+        )
 
     def put(self, request, pk):
         # 상품 정보 수정
@@ -75,7 +161,7 @@ class ProductDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        product.delete()
+        product.delete()  # 해시태그 상품 수 / 이미지 참조는 products/signals.py 에서 정리
         return Response(
             {"detail": "상품이 삭제되었습니다."},
             status=status.HTTP_204_NO_CONTENT,
@@ -114,6 +200,74 @@ class ProductLikeView(APIView):
         return Response({"detail": "상품 좋아요/찜 취소."}, status=status.HTTP_200_OK)
 
 
+def stock_error_response(error):
+    # 재고 부족 : 409, 그 외(존재하지 않는 상품/유효하지 않은 예약) : 400
+    if error.code == "out_of_stock":
+        return Response({"detail": error.message}, status=status.HTTP_409_CONFLICT)
+    return Response({"detail": error.message}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class ProductReserveView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        # 재고 예약 (일정 시간 후 만료되면 재고 반환)
+        serializer = ReservationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            reservation = stock.reserve(
+                request.user, pk, serializer.validated_data["quantity"]
+            )
+        except ValidationError as e:
+            return stock_error_response(e)
+        return Response(
+            ReservationSerializer(reservation).data, status=status.HTTP_201_CREATED
+        )
+
+
+class CheckoutView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        # 여러 상품 구매 / 예약 확정 (한 트랜잭션)
+        serializer = CheckoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = [
+            (item["product"], item["quantity"])
+            for item in serializer.validated_data["items"]
+        ]
+        try:
+            stock.checkout(
+                request.user,
+                items=items,
+                reservation_ids=serializer.validated_data["reservations"],
+            )
+        except ValidationError as e:
+            return stock_error_response(e)
+        return Response({"detail": "구매 완료"}, status=status.HTTP_200_OK)
+
+
+class ProductLikeListView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        # 내가 좋아요/찜한 상품 목록 (좋아요 시각 기준 keyset 페이지네이션)
+        likes = (
+            ProductLike.objects.filter(user=request.user, product__author__is_active=True)
+            .select_related("product__author")
+            .prefetch_related("product__hashtags")
+        )
+
+        paginator = ProductCursorPagination()  # created_at = 좋아요 시각
+        paginated_likes = paginator.paginate_queryset(likes, request)
+
+        liked_ids = {like.product_id for like in paginated_likes}
+        serializer = ProductLikeSerializer(
+            paginated_likes, many=True, context={"liked_ids": liked_ids}
+        )
+        return paginator.get_paginated_response(serializer.data)
+
+
 class CategoryListView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -121,3 +275,47 @@ class CategoryListView(APIView):
         categories = Category.objects.all()  # 모든 카테고리 가져오기
         serializer = CategorySerializer(categories, many=True)  # 직렬화
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class TopHashTagListView(APIView):
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    max_limit = 50
+
+    def get(self, request):
+        # 인기 해시태그 (저장된 상품 수 기준, product_count 인덱스 사용)
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            return Response(
+                {"detail": "limit은 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        limit = max(1, min(limit, self.max_limit))
+
+        hashtags = HashTag.objects.filter(product_count__gt=0).order_by(
+            "-product_count", "name"
+        )[:limit]
+        serializer = HashTagCountSerializer(hashtags, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class HashTagAutocompleteView(APIView):
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    max_limit = 20
+
+    def get(self, request):
+        # 입력 중인 해시태그 자동완성 (프로세스 내 인덱스 사용, DB 조회 없음)
+        prefix = request.query_params.get("q", "").lstrip("#").strip()
+        if not prefix:
+            return Response([], status=status.HTTP_200_OK)
+
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            return Response(
+                {"detail": "limit은 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        limit = max(1, min(limit, self.max_limit))
+
+        return Response(hashtag_index.suggest(prefix, limit), status=status.HTTP_200_OK)
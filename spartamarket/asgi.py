@@ -14,3 +14,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'spartamarket.settings')
 
 application = get_asgi_application()
+
+from django.conf import settings
+
+if getattr(settings, 'WARMUP', False):
+    from .warmup import warm_up
+
+    warm_up()
@@ -0,0 +1,126 @@
+from django.core.cache import cache
+from django.db import connections
+from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # Brotli 미설치 시 gzip만 사용
+    brotli = None
+
+
+def _accepted_encodings(header):
+    # Accept-Encoding 파싱 : {"br": 1.0, "gzip": 0.8, ...}
+    encodings = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            encodings[name.strip().lower()] = quality
+    return encodings
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    큰 JSON/텍스트 응답 압축
+    - Accept-Encoding 에 따라 brotli 우선, 그 외 gzip
+    - 스트리밍 응답(미디어 파일 등)과 작은 응답은 압축하지 않음
+    """
+
+    min_length = 1024
+    brotli_quality = 4  # 동적 응답용 (압축률보다 속도 우선)
+    max_random_bytes = 100
+    compressible_types = ("application/json", "text/")
+
+    def choose_encoding(self, request):
+        accepted = _accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+        candidates = [name for name in candidates if accepted.get(name, 0) > 0]
+        if not candidates:
+            return None
+        # q 값이 높은 순, 같으면 br 우선
+        return max(candidates, key=lambda name: accepted[name])
+
+    def process_response(self, request, response):
+        if response.streaming or len(response.content) < self.min_length:
+            return response
+        if response.has_header("Content-Encoding"):
+            return response
+        if not response.get("Content-Type", "").startswith(self.compressible_types):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = self.choose_encoding(request)
+        if encoding is None:
+            return response
+
+        if encoding == "br":
+            compressed_content = brotli.compress(
+                response.content, quality=self.brotli_quality
+            )
+        else:
+            compressed_content = compress_string(
+                response.content, max_random_bytes=self.max_random_bytes
+            )
+        if len(compressed_content) >= len(response.content):
+            return response
+
+        response.content = compressed_content
+        response.headers["Content-Length"] = str(len(response.content))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+
+        return response
+
+
+class HealthCheckMiddleware(MiddlewareMixin):
+    """
+    로드밸런서/오케스트레이터용 상태 확인 (MIDDLEWARE 첫 번째에 위치)
+    - 인증, 세션, Host 검사 등 이후 미들웨어와 URL 라우팅을 거치지 않음
+    - /healthz : 프로세스 응답 여부만 확인 (DB 조회 없음)
+    - /readyz : DB / 공유 캐시 연결 확인, 실패 시 503
+    """
+
+    liveness_path = "/healthz"
+    readiness_path = "/readyz"
+
+    def process_request(self, request):
+        path = request.path_info.rstrip("/")
+        if path == self.liveness_path:
+            return JsonResponse({"status": "ok"})
+        if path == self.readiness_path:
+            return self.readiness()
+        return None
+
+    def readiness(self):
+        checks = {}
+        for alias in connections:
+            try:
+                with connections[alias].cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                checks[f"db:{alias}"] = "ok"
+            except Exception:
+                checks[f"db:{alias}"] = "error"
+        try:
+            cache.set("readyz", 1, 10)
+            checks["cache"] = "ok" if cache.get("readyz") == 1 else "error"
+        except Exception:
+            checks["cache"] = "error"
+
+        ready = all(result == "ok" for result in checks.values())
+        return JsonResponse(
+            {"status": "ok" if ready else "unavailable", "checks": checks},
+            status=200 if ready else 503,
+        )
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -50,7 +51,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'spartamarket.middleware.HealthCheckMiddleware',  # /healthz, /readyz (다른 미들웨어보다 먼저)
     'django.middleware.security.SecurityMiddleware',
+    'spartamarket.middleware.CompressionMiddleware',  # 응답 압축 (br/gzip)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -149,6 +152,17 @@ REST_FRAMEWORK = {
     # pagenation
     'DEFAULT_PAGINATION_CLASS' : 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE' : 5,  # 페이지당 보여줄 개수
+    # 요청 제한 (spartamarket/throttling.py, 공유 캐시 사용)
+    'DEFAULT_THROTTLE_CLASSES': (
+        'spartamarket.throttling.WriteRateThrottle',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': '20/min',
+        'login_account': '5/min',
+        'signup_ip': '10/hour',
+        'signup_account': '3/hour',
+        'write': '60/min',
+    },
 }
 
 # JWT 설정
@@ -171,8 +185,35 @@ SPECTACULAR_SETTINGS = {
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
-CACHES = {
+# 업로드 파일은 내용 해시 기준으로 중복 없이 저장
+STORAGES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'BACKEND': 'products.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+# 상품 보관 규칙 (archive_products 명령, products/archive.py)
+# 재고가 MAX_QUANTITY 이하이고 INACTIVE_DAYS 동안 수정되지 않은 상품을 보관 테이블로 이동
+PRODUCT_ARCHIVE_RULES = {
+    'MAX_QUANTITY': 0,
+    'INACTIVE_DAYS': 90,
+    'BATCH_SIZE': 500,
+}
+
+# 공유 캐시 : REDIS_URL 설정 시 Redis 사용 (워커 간 요청 제한/스냅샷 공유)
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
     }
-}
\ No newline at end of file
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Production settings for spartamarket project.
+
+DJANGO_SETTINGS_MODULE=spartamarket.settings_production 으로 선택합니다.
+- 개발용 앱(django_seed, drf_spectacular) 제외, admin은 DJANGO_ENABLE_ADMIN=1 일 때만 사용
+- DEBUG 비활성화 (쿼리 기록 없음)
+- 템플릿 캐시 로더 사용
+- 워커 시작 시 URL/serializer 미리 로딩 (spartamarket/warmup.py)
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+from .settings import INSTALLED_APPS, MIDDLEWARE, REST_FRAMEWORK, TEMPLATES
+
+DEBUG = False
+
+SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost').split(',')
+
+ENABLE_ADMIN = os.environ.get('DJANGO_ENABLE_ADMIN') == '1'
+
+# 개발용 앱 제외
+DEV_APPS = ['django_seed', 'drf_spectacular']
+# admin 전용 앱/미들웨어 (JWT 인증만 사용하는 API에는 불필요)
+ADMIN_APPS = ['django.contrib.admin', 'django.contrib.sessions', 'django.contrib.messages']
+ADMIN_MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
+
+INSTALLED_APPS = [
+    app for app in INSTALLED_APPS
+    if app not in DEV_APPS and (ENABLE_ADMIN or app not in ADMIN_APPS)
+]
+
+MIDDLEWARE = [
+    middleware for middleware in MIDDLEWARE
+    if ENABLE_ADMIN or middleware not in ADMIN_MIDDLEWARE
+]
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.openapi.AutoSchema',
+    # Browsable API 제외 (템플릿 렌더링 없음)
+    'DEFAULT_RENDERER_CLASSES': (
+        'rest_framework.renderers.JSONRenderer',
+    ),
+}
+
+# 템플릿 캐시 로더
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        'APP_DIRS': False,
+        'OPTIONS': {
+            **TEMPLATES[0]['OPTIONS'],
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+        },
+    },
+]
+if not ENABLE_ADMIN:
+    TEMPLATES[0]['OPTIONS']['context_processors'] = [
+        'django.template.context_processors.request',
+        'django.contrib.auth.context_processors.auth',
+    ]
+
+# PostgreSQL (POSTGRES_DB 설정 시), 커넥션 재사용
+if os.environ.get('POSTGRES_DB'):
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ['POSTGRES_DB'],
+            'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            'CONN_MAX_AGE': 60,
+            'CONN_HEALTH_CHECKS': True,
+        }
+    }
+
+# 쿼리 로그 비활성화
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'root': {'handlers': ['console'], 'level': 'WARNING'},
+    'loggers': {
+        'django.db.backends': {'level': 'WARNING', 'propagate': False},
+    },
+}
+
+# 워커 시작 시 미리 로딩
+WARMUP = True
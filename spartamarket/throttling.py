@@ -0,0 +1,120 @@
+import hashlib
+from collections.abc import Mapping
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    공유 캐시 기반 sliding window 카운터
+    - 현재/이전 고정 구간 카운터를 가중 합산하여 요청 수 추정
+    - 카운터 증가는 캐시의 atomic incr 사용 (요청 기록 리스트를 저장하지 않음)
+    - 요청당 캐시 호출 2~3회
+    """
+
+    cache_format = "throttle_%(scope)s_%(ident)s"
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        current_key = f"{self.key}:{window}"
+        previous_key = f"{self.key}:{window - 1}"
+
+        current = self._incr(current_key)
+        previous = self.cache.get(previous_key, 0)
+
+        # 현재 구간 경과 비율만큼 이전 구간 카운트를 제외
+        self.elapsed = self.now - window * self.duration
+        weight = 1 - self.elapsed / self.duration
+        estimated = previous * weight + current
+        if estimated <= self.num_requests:
+            return True
+
+        self.current = current
+        self.previous = previous
+        return self.throttle_failure()
+
+    def _incr(self, key):
+        # 두 구간 동안 유지 (이전 구간 카운트로 사용)
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            if self.cache.add(key, 1, self.duration * 2):
+                return 1
+            return self.cache.incr(key)
+
+    def wait(self):
+        # 거절된 요청도 카운트되므로 재시도 요청(+1)까지 한도 이하가 되는 시점 계산
+        remaining = self.duration - self.elapsed
+        if self.current >= self.num_requests - 1:
+            # 현재 구간에서는 불가 : 다음 구간에서 현재 구간 카운트의 가중치가 충분히 줄어드는 시점
+            needed = 1 - (self.num_requests - 1) / self.current
+            return remaining + max(needed, 0) * self.duration
+        # 이전 구간 가중치가 줄어들어 previous * w + current + 1 <= 한도가 되는 시점
+        needed = 1 - (self.num_requests - self.current - 1) / self.previous
+        return max(needed * self.duration - self.elapsed, 1)
+
+
+def _hash_ident(value):
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+class IPRateThrottle(SlidingWindowRateThrottle):
+    # IP 기준 (인증 전 요청)
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class AccountRateThrottle(SlidingWindowRateThrottle):
+    # 요청 데이터의 이메일 기준 (인증 전 요청)
+    # 형식이 잘못된 요청은 계정 기준 제한 없이 IP 기준 제한만 적용
+    def get_cache_key(self, request, view):
+        data = request.data
+        email = data.get("email") if isinstance(data, Mapping) else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": _hash_ident(email.strip().lower()),
+        }
+
+
+class LoginIPThrottle(IPRateThrottle):
+    scope = "login_ip"
+
+
+class LoginAccountThrottle(AccountRateThrottle):
+    scope = "login_account"
+
+
+class SignupIPThrottle(IPRateThrottle):
+    scope = "signup_ip"
+
+
+class SignupAccountThrottle(AccountRateThrottle):
+    scope = "signup_account"
+
+
+class WriteRateThrottle(SlidingWindowRateThrottle):
+    # 쓰기 요청만 제한 (로그인 사용자는 계정 기준, 그 외 IP 기준)
+    scope = "write"
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+
+    def get_cache_key(self, request, view):
+        if request.method in self.safe_methods:
+            return None
+        if request.user and request.user.is_authenticated:
+            ident = f"user_{request.user.pk}"
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
@@ -0,0 +1,26 @@
+import os
+
+from django.conf import settings
+from django.http import HttpResponseNotModified
+from django.views.static import serve
+
+# 내용 해시로 저장된 파일은 변경되지 않으므로 장기 캐시
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def serve_media(request, path):
+    response_headers = {}
+    if path.startswith("cas/"):
+        digest = os.path.splitext(os.path.basename(path))[0]
+        etag = f'"{digest}"'
+        if request.headers.get("If-None-Match") == etag:
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            return response
+        response_headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    for header, value in response_headers.items():
+        response[header] = value
+    return response
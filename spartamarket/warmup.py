@@ -0,0 +1,64 @@
+import logging
+
+from django.core.cache import cache
+from django.db import connections
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up():
+    """
+    워커가 요청을 받기 전에 지연 로딩되는 항목을 미리 준비
+    - URL resolver 패턴 컴파일 및 reverse 테이블 생성
+    - serializer 필드 생성 (모델 메타 정보, 필드 매핑 캐시)
+    """
+    resolver = get_resolver()
+    resolver.reverse_dict  # 전체 URL 패턴 로딩
+    for _, app_resolver in resolver.namespace_dict.values():
+        app_resolver.reverse_dict
+
+    from accounts.serializers import (
+        SignupSerializer,
+        UserProfileSerializer,
+        UserUpdateSerializer,
+    )
+    from products.serializers import (
+        CategorySerializer,
+        HashTagCountSerializer,
+        ProductLikeSerializer,
+        ProductSerializer,
+    )
+
+    for serializer_class in (
+        SignupSerializer,
+        UserProfileSerializer,
+        UserUpdateSerializer,
+        CategorySerializer,
+        HashTagCountSerializer,
+        ProductLikeSerializer,
+        ProductSerializer,
+    ):
+        serializer_class().fields
+
+
+def warm_connections():
+    """
+    fork 이후 워커별로 연결/캐시 준비 (gunicorn.conf.py post_worker_init)
+    - DB 커넥션 생성 (CONN_MAX_AGE 동안 재사용)
+    - 공유 캐시 연결 및 해시태그 자동완성 인덱스 로딩
+    - 실패해도 워커는 시작 (첫 요청에서 다시 연결)
+    """
+    for alias in connections:
+        try:
+            connections[alias].ensure_connection()
+        except Exception:
+            logger.warning("DB 연결 준비 실패: %s", alias, exc_info=True)
+
+    try:
+        cache.get("warmup")
+        from products.hashtag_index import hashtag_index
+
+        hashtag_index.refresh()
+    except Exception:
+        logger.warning("캐시/자동완성 인덱스 준비 실패", exc_info=True)
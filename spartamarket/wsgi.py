@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'spartamarket.settings')
 
 application = get_wsgi_application()
+
+from django.conf import settings
+
+if getattr(settings, 'WARMUP', False):
+    from .warmup import warm_up
+
+    warm_up()